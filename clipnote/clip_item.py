@@ -1,7 +1,8 @@
 """Data model for clipboard items."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Tuple
 from enum import Enum
 from urllib.parse import unquote, urlparse
 import os
@@ -28,6 +29,10 @@ class ClipItem:
     file_uris: Optional[List[str]] = None
     content_hash: str = ""
     pinned: bool = False
+    # Last relative time text, keyed by the second and timestamp it was made for
+    _relative_time: Tuple[int, float, str] = field(
+        default=(-1, 0.0, ""), init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_text(cls, text: str, content_hash: str = "") -> "ClipItem":
@@ -86,14 +91,28 @@ class ClipItem:
             content_hash=content_hash,
         )
 
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased text searched by the filter, built on first use."""
+        return " ".join([self.preview, self.text_content or "", *(self.file_uris or [])]).lower()
+
     def get_display_text(self) -> str:
         """Get text for display in list."""
         return self.preview
 
     def get_relative_time(self) -> str:
-        """Get human-readable relative timestamp."""
-        delta = time.time() - self.timestamp
-
+        """Get human-readable relative timestamp, formatted at most once a second."""
+        now = time.time()
+        second = int(now)
+        cached_second, cached_timestamp, text = self._relative_time
+        if cached_second != second or cached_timestamp != self.timestamp:
+            text = self._format_relative_time(now - self.timestamp)
+            self._relative_time = (second, self.timestamp, text)
+        return text
+
+    @staticmethod
+    def _format_relative_time(delta: float) -> str:
+        """Format an age in seconds as e.g. "5m ago"."""
         if delta < 60:
             return "just now"
         elif delta < 3600:
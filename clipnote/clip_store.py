@@ -1,5 +1,6 @@
 """Persistent storage for clipboard items using SQLite."""
 
+from dataclasses import replace
 from typing import Callable, List, Optional
 
 from .clip_item import ClipItem, ClipType
@@ -12,6 +13,8 @@ class ClipStore:
     def __init__(self, max_items: int = 100, database: Optional[Database] = None):
         self._max_items = max_items
         self._listeners: List[Callable[[], None]] = []
+        # Bumped on every change so views can tell whether they are current
+        self.version = 0
         self._db = database or Database()
 
         # Load existing items from database
@@ -38,13 +41,6 @@ class ClipStore:
         """Get all items (pinned first, then newest)."""
         return self._items.copy()
 
-    def search_items(self, query: str) -> List[ClipItem]:
-        """Search items by query."""
-        if not query:
-            return self.get_all_items()
-
-        return self._db.search_clips(query, limit=self._max_items)
-
     def get_item_by_id(self, item_id: str) -> Optional[ClipItem]:
         """Get a specific item by ID."""
         return self._db.get_clip_by_id(item_id)
@@ -72,8 +68,21 @@ class ClipStore:
         return count
 
     def _reload_items(self) -> None:
-        """Reload items from database."""
-        self._items = self._db.get_all_clips(limit=self._max_items)
+        """Reload items from database.
+
+        Items whose content is unchanged keep their previous instance (with
+        the new timestamp and pin state), so anything cached on them (search
+        text, relative time) survives the reload.
+        """
+        previous = {item.id: item for item in self._items}
+        items = self._db.get_all_clips(limit=self._max_items)
+        for index, item in enumerate(items):
+            old = previous.get(item.id)
+            if old is not None and replace(item, timestamp=old.timestamp, pinned=old.pinned) == old:
+                old.timestamp = item.timestamp
+                old.pinned = item.pinned
+                items[index] = old
+        self._items = items
 
     def add_listener(self, callback: Callable[[], None]) -> None:
         """Add a listener to be notified when store changes."""
@@ -86,6 +95,7 @@ class ClipStore:
 
     def _notify_listeners(self) -> None:
         """Notify all listeners of a change."""
+        self.version += 1
         for callback in self._listeners:
             callback()
 
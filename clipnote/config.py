@@ -59,6 +59,9 @@ class ConfigManager:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._config = self._load_config()
+        # Membership index of config.excluded_apps; the list keeps the order
+        # and is what gets saved
+        self._excluded_apps_set = set(self._config.excluded_apps)
         self._listeners: List[Callable[[Config], None]] = []
 
     def _load_config(self) -> Config:
@@ -92,6 +95,8 @@ class ConfigManager:
         for key, value in kwargs.items():
             if hasattr(self._config, key):
                 setattr(self._config, key, value)
+        if "excluded_apps" in kwargs:
+            self._excluded_apps_set = set(self._config.excluded_apps)
         self.save_config()
         self._notify_listeners()
 
@@ -117,20 +122,24 @@ class ConfigManager:
         self.update(private_mode=new_state)
         return new_state
 
-    def add_excluded_app(self, app_id: str) -> None:
-        """Add an app to the exclusion list."""
-        if app_id not in self._config.excluded_apps:
-            self._config.excluded_apps.append(app_id)
-            self.save_config()
-            self._notify_listeners()
+    def add_excluded_app(self, app_id: str) -> bool:
+        """Add an app to the exclusion list. Returns False if it was already there."""
+        if app_id in self._excluded_apps_set:
+            return False
+        self._config.excluded_apps.append(app_id)
+        self._excluded_apps_set.add(app_id)
+        self.save_config()
+        self._notify_listeners()
+        return True
 
     def remove_excluded_app(self, app_id: str) -> None:
         """Remove an app from the exclusion list."""
-        if app_id in self._config.excluded_apps:
+        if app_id in self._excluded_apps_set:
             self._config.excluded_apps.remove(app_id)
+            self._excluded_apps_set.discard(app_id)
             self.save_config()
             self._notify_listeners()
 
     def is_app_excluded(self, app_id: str) -> bool:
         """Check if an app is in the exclusion list."""
-        return app_id in self._config.excluded_apps
+        return app_id in self._excluded_apps_set
@@ -8,12 +8,23 @@ from contextlib import contextmanager
 
 from .clip_item import ClipItem, ClipType
 
+# Number of body characters shown in the notes list
+NOTE_PREVIEW_LENGTH = 100
+
+
+def make_note_preview(body: str) -> str:
+    """Build the single-line list preview for a note body."""
+    preview = body[:NOTE_PREVIEW_LENGTH].replace("\n", " ")
+    if len(body) > NOTE_PREVIEW_LENGTH:
+        preview += "..."
+    return preview
+
 
 class Database:
     """SQLite database manager for ClipNote."""
 
     # Current database schema version
-    DB_VERSION = 2
+    DB_VERSION = 3
 
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
@@ -22,6 +33,9 @@ class Database:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Bumped by every notes write so views can tell if they're stale
+        self.notes_version = 0
+
         self._init_db()
         self._migrate_db()
 
@@ -30,6 +44,9 @@ class Database:
         """Get a database connection with context management."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
+        # With WAL a commit only has to fsync at checkpoints, so rapid
+        # single-row writes (pin, delete, save) don't each wait on the disk
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -39,11 +56,25 @@ class Database:
         finally:
             conn.close()
 
+    @contextmanager
+    def _notes_write(self):
+        """Connection for a notes write; notes_version is bumped once it's committed.
+
+        Bumping after the commit means a reader that sees the new version
+        also sees the write, whichever thread made it.
+        """
+        with self._get_connection() as conn:
+            yield conn
+        self.notes_version += 1
+
     def _init_db(self) -> None:
         """Initialize database tables."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # Persistent; lets writes append to the log instead of the main file
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Clips table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS clips (
@@ -67,7 +98,8 @@ class Database:
                     title TEXT NOT NULL,
                     body TEXT NOT NULL,
                     pinned INTEGER DEFAULT 0,
-                    color TEXT DEFAULT 'blue'
+                    color TEXT DEFAULT 'blue',
+                    preview TEXT
                 )
             """)
 
@@ -80,6 +112,10 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_clips_pinned
                 ON clips(pinned DESC, timestamp DESC)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_notes_pinned
+                ON notes(pinned DESC, timestamp DESC)
+            """)
 
             # DB version table for migrations
             cursor.execute("""
@@ -107,6 +143,20 @@ class Database:
                     pass
                 cursor.execute("INSERT OR REPLACE INTO db_version (version) VALUES (2)")
 
+            if current_version < 3:
+                # Migration 3: Store the list preview alongside the note body
+                try:
+                    cursor.execute("ALTER TABLE notes ADD COLUMN preview TEXT")
+                except sqlite3.OperationalError:
+                    # Column already exists
+                    pass
+                cursor.execute("SELECT id, body FROM notes WHERE preview IS NULL")
+                cursor.executemany(
+                    "UPDATE notes SET preview = ? WHERE id = ?",
+                    [(make_note_preview(row['body']), row['id']) for row in cursor.fetchall()]
+                )
+                cursor.execute("INSERT OR REPLACE INTO db_version (version) VALUES (3)")
+
     # ============ CLIPS METHODS ============
 
     def add_clip(self, item: ClipItem) -> None:
@@ -129,7 +179,7 @@ class Database:
                 item.image_path,
                 file_uris_json,
                 item.content_hash,
-                getattr(item, 'pinned', False)
+                item.pinned
             ))
 
     def get_all_clips(self, limit: int = 100) -> List[ClipItem]:
@@ -260,12 +310,12 @@ class Database:
 
     def add_note(self, note_id: str, title: str, body: str, timestamp: float, color: str = 'blue') -> None:
         """Add a note to the database."""
-        with self._get_connection() as conn:
+        with self._notes_write() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT OR REPLACE INTO notes (id, timestamp, title, body, pinned, color)
-                VALUES (?, ?, ?, ?, 0, ?)
-            """, (note_id, timestamp, title, body, color))
+                INSERT OR REPLACE INTO notes (id, timestamp, title, body, pinned, color, preview)
+                VALUES (?, ?, ?, ?, 0, ?, ?)
+            """, (note_id, timestamp, title, body, color, make_note_preview(body)))
 
     def get_all_notes(self) -> List[dict]:
         """Get all notes."""
@@ -285,25 +335,36 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def update_note(self, note_id: str, title: str, body: str, color: Optional[str] = None) -> bool:
-        """Update a note."""
-        with self._get_connection() as conn:
+    def update_note(
+        self,
+        note_id: str,
+        title: str,
+        body: Optional[str] = None,
+        color: Optional[str] = None
+    ) -> bool:
+        """Update a note.
+
+        A body or color of None leaves that column as it is, so saving
+        a title change doesn't send an unchanged (possibly large) body.
+        """
+        assignments = ["title = ?"]
+        params: List[object] = [title]
+        if body is not None:
+            assignments.append("body = ?, preview = ?")
+            params += [body, make_note_preview(body)]
+        if color is not None:
+            assignments.append("color = ?")
+            params.append(color)
+        params.append(note_id)
+
+        with self._notes_write() as conn:
             cursor = conn.cursor()
-            if color is not None:
-                cursor.execute(
-                    "UPDATE notes SET title = ?, body = ?, color = ? WHERE id = ?",
-                    (title, body, color, note_id)
-                )
-            else:
-                cursor.execute(
-                    "UPDATE notes SET title = ?, body = ? WHERE id = ?",
-                    (title, body, note_id)
-                )
+            cursor.execute(f"UPDATE notes SET {', '.join(assignments)} WHERE id = ?", params)
             return cursor.rowcount > 0
 
     def update_note_color(self, note_id: str, color: str) -> bool:
         """Update a note's color."""
-        with self._get_connection() as conn:
+        with self._notes_write() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE notes SET color = ? WHERE id = ?",
@@ -313,14 +374,21 @@ class Database:
 
     def delete_note(self, note_id: str) -> bool:
         """Delete a note by ID."""
-        with self._get_connection() as conn:
+        with self._notes_write() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
             return cursor.rowcount > 0
 
+    def clear_all_notes(self) -> int:
+        """Delete all notes. Returns count of deleted notes."""
+        with self._notes_write() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM notes")
+            return cursor.rowcount
+
     def toggle_note_pinned(self, note_id: str) -> bool:
         """Toggle the pinned status of a note."""
-        with self._get_connection() as conn:
+        with self._notes_write() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT pinned FROM notes WHERE id = ?", (note_id,))
             row = cursor.fetchone()
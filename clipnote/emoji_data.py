@@ -248,3 +248,10 @@ EMOJI_DATA = [
     {"char": "♻️", "name": "recycling symbol", "keywords": ["recycle", "environment", "green"]},
     {"char": "🚩", "name": "triangular flag", "keywords": ["red flag", "marker"]},
 ]
+
+# (char, lowercased search text) pairs built once at import so filtering
+# is a single substring test per emoji
+EMOJI_SEARCH_BLOBS = [
+    (e["char"], " ".join([e["name"], *e["keywords"], e["char"]]).lower())
+    for e in EMOJI_DATA
+]
@@ -6,6 +6,7 @@ Provides cross-platform hotkey registration for Wayland (GNOME) and X11.
 import os
 import subprocess
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -492,6 +493,7 @@ class HotkeyManager:
         return FallbackHotkeyBackend()
 
 
+@lru_cache(maxsize=64)
 def format_keybinding(keybinding: str) -> str:
     """Format keybinding for display.
 
@@ -518,6 +520,7 @@ def format_keybinding(keybinding: str) -> str:
     return result
 
 
+@lru_cache(maxsize=64)
 def parse_keybinding(display_str: str) -> str:
     """Parse display format to GTK keybinding format.
 
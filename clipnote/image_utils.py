@@ -1,6 +1,7 @@
 """Image handling utilities for clipboard images."""
 
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -11,6 +12,18 @@ gi.require_version("GdkPixbuf", "2.0")
 
 from gi.repository import Gdk, GdkPixbuf, GLib
 
+# Most recently used thumbnail textures, keyed by (image_path, size).
+# Cached images are named by content hash and never rewritten, so an
+# entry can't go stale; the cap only bounds memory.
+THUMBNAIL_CACHE_SIZE = 256
+_thumbnail_cache: "OrderedDict[Tuple[str, int], Gdk.Texture]" = OrderedDict()
+
+# Most recently restored full-size images, keyed by image_path, so pasting
+# the same image again doesn't decode it again. Kept small: these are
+# whole images, not thumbnails.
+IMAGE_TEXTURE_CACHE_SIZE = 4
+_image_texture_cache: "OrderedDict[str, Gdk.Texture]" = OrderedDict()
+
 
 def texture_to_pixbuf(texture: Gdk.Texture) -> Optional[GdkPixbuf.Pixbuf]:
     """Convert a GdkTexture to a GdkPixbuf."""
@@ -87,3 +100,76 @@ def create_thumbnail(pixbuf: GdkPixbuf.Pixbuf, size: int = 48) -> GdkPixbuf.Pixb
 def get_image_dimensions(pixbuf: GdkPixbuf.Pixbuf) -> Tuple[int, int]:
     """Get the dimensions of a pixbuf."""
     return pixbuf.get_width(), pixbuf.get_height()
+
+
+def get_cached_thumbnail(image_path: str, size: int = 48) -> Optional[Gdk.Texture]:
+    """Return a cached thumbnail texture, or None if it isn't decoded yet."""
+    key = (image_path, size)
+    texture = _thumbnail_cache.get(key)
+    if texture is not None:
+        _thumbnail_cache.move_to_end(key)
+    return texture
+
+
+def _thumbnail_path(image_path: str, size: int) -> Path:
+    """Where the thumbnail of a cached image is kept on disk.
+
+    Cached images are named by content hash, so the name is stable too.
+    """
+    image = Path(image_path)
+    return image.parent / "thumbs" / f"{image.stem}_{size}.png"
+
+
+def decode_thumbnail(image_path: str, size: int = 48) -> Optional[GdkPixbuf.Pixbuf]:
+    """Load the thumbnail of a cached image. Safe to call from a worker thread.
+
+    The thumbnail is read from disk if an earlier run saved it; otherwise
+    the image is decoded at thumbnail size and the result saved for next time.
+    """
+    thumbnail_path = _thumbnail_path(image_path, size)
+    try:
+        return GdkPixbuf.Pixbuf.new_from_file(str(thumbnail_path))
+    except GLib.Error:
+        pass
+
+    # Scaled while decoding, so the full-size image is never held in memory
+    try:
+        thumbnail = GdkPixbuf.Pixbuf.new_from_file_at_scale(image_path, size, size, True)
+    except GLib.Error as e:
+        print(f"Error loading image from cache: {e}")
+        return None
+
+    try:
+        thumbnail_path.parent.mkdir(exist_ok=True)
+        thumbnail.savev(str(thumbnail_path), "png", [], [])
+    except (OSError, GLib.Error) as e:
+        print(f"Error saving thumbnail to cache: {e}")
+    return thumbnail
+
+
+def get_image_texture(image_path: str) -> Optional[Gdk.Texture]:
+    """Return the full-size texture of a cached image, decoding it on a miss."""
+    texture = _image_texture_cache.get(image_path)
+    if texture is not None:
+        _image_texture_cache.move_to_end(image_path)
+        return texture
+
+    try:
+        texture = Gdk.Texture.new_from_filename(image_path)
+    except GLib.Error as e:
+        print(f"Error loading image from cache: {e}")
+        return None
+
+    _image_texture_cache[image_path] = texture
+    if len(_image_texture_cache) > IMAGE_TEXTURE_CACHE_SIZE:
+        _image_texture_cache.popitem(last=False)
+    return texture
+
+
+def cache_thumbnail(image_path: str, size: int, thumbnail: GdkPixbuf.Pixbuf) -> Gdk.Texture:
+    """Turn a decoded thumbnail into a texture and cache it (main thread)."""
+    texture = Gdk.Texture.new_for_pixbuf(thumbnail)
+    _thumbnail_cache[(image_path, size)] = texture
+    if len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+        _thumbnail_cache.popitem(last=False)
+    return texture
@@ -3,7 +3,7 @@
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import gi
 
@@ -11,7 +11,7 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("Gdk", "4.0")
 
-from gi.repository import Adw, Gdk, Gio, GLib, Gtk
+from gi.repository import Adw, Gdk, Gio, GLib
 
 from .clip_store import ClipStore
 from .clipboard_watcher import ClipboardWatcher
@@ -22,7 +22,10 @@ from .hotkey_manager import (
     HotkeyManager,
     detect_display_server,
 )
-from .popup_window import PopupWindow
+from .style import ensure_css
+
+if TYPE_CHECKING:
+    from .popup_window import PopupWindow
 
 
 class ClipNoteApp(Adw.Application):
@@ -50,7 +53,7 @@ class ClipNoteApp(Adw.Application):
             database=self.database
         )
         self.watcher: Optional[ClipboardWatcher] = None
-        self.window: Optional[PopupWindow] = None
+        self.window: Optional["PopupWindow"] = None
 
         # Hotkey management
         self.display_server = detect_display_server()
@@ -69,27 +72,29 @@ class ClipNoteApp(Adw.Application):
         """Handle application startup - load CSS and setup hotkey."""
         Adw.Application.do_startup(self)
         self._load_css()
+        self._setup_actions()
         self._setup_hotkey()
 
     def _load_css(self) -> None:
         """Load custom CSS stylesheet."""
-        css_provider = Gtk.CssProvider()
-
-        # Get the path to the CSS file relative to this module
-        css_path = Path(__file__).parent / "style.css"
-
-        if css_path.exists():
-            css_provider.load_from_path(str(css_path))
-
-            # Add the CSS provider to the default display
-            Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(),
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-            print(f"ClipNote: Loaded custom CSS from {css_path}")
-        else:
-            print(f"ClipNote: CSS file not found at {css_path}")
+        ensure_css(Gdk.Display.get_default())
+
+    def _setup_actions(self) -> None:
+        """Add the application actions."""
+        # Activated from the settings dialog
+        clear_action = Gio.SimpleAction.new("clear-all-data", None)
+        clear_action.connect("activate", self._on_clear_all_data)
+        self.add_action(clear_action)
+
+    def _on_clear_all_data(self, action: Gio.SimpleAction, param) -> None:
+        """Delete all clipboard history, pinned items included, and all notes."""
+        clip_count = self.store.clear(keep_pinned=False)
+        note_count = self.database.clear_all_notes()
+        print(f"ClipNote: Cleared {clip_count} clipboard items and {note_count} notes")
+        # The clipboard list follows the store; the notes list reloads from
+        # the notes version, now if it is showing or else when next shown
+        if self.window:
+            self.window.refresh_notes()
 
     def _setup_hotkey(self) -> None:
         """Setup global hotkey registration."""
@@ -151,7 +156,10 @@ class ClipNoteApp(Adw.Application):
     def do_activate(self) -> None:
         """Handle application activation."""
         if not self.window:
-            # First activation - create window and start watcher
+            # First activation - create window and start watcher. The popup
+            # module is only imported here, after startup has registered the
+            # hotkey.
+            from .popup_window import PopupWindow
             self.window = PopupWindow(
                 self,
                 self.store,
@@ -3,93 +3,202 @@
 import gi
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("Gdk", "4.0")
-gi.require_version("GdkPixbuf", "2.0")
 
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk, Pango
+from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk
 
 from .clip_item import ClipItem, ClipType
 from .clip_store import ClipStore
 from .config import ConfigManager
 from .database import Database
-from .emoji_data import EMOJI_DATA
-from .image_utils import create_thumbnail, load_image_from_cache
+from .image_utils import cache_thumbnail, decode_thumbnail, get_cached_thumbnail, get_image_texture
+from .style import ensure_css
 
 
-class ClipItemRow(Adw.ActionRow):
-    """A row widget representing a single clipboard item."""
+@lru_cache(maxsize=16)
+def _file_list_content(uris: Tuple[str, ...]) -> Gdk.ContentProvider:
+    """Clipboard content for a list of file URIs, as a Gdk.FileList.
 
-    def __init__(
-        self,
-        clip_item: ClipItem,
-        on_delete: Optional[Callable[[str], None]] = None,
-        on_pin: Optional[Callable[[str], None]] = None
-    ):
+    GDK serializes the file list to every format it has for one
+    (uri-list, plain paths, the portal file transfer), so it is kept as
+    a value provider. Providers are cached per URI list, so copying the
+    same files again doesn't create the Gio.Files and FileList again.
+    """
+    files = [Gio.File.new_for_uri(uri) for uri in uris]
+    return Gdk.ContentProvider.new_for_value(Gdk.FileList.new_from_list(files))
+
+
+def _emoji_char(entry: str) -> str:
+    """Get the emoji of an emoji model entry (the emoji, a tab, its search text)."""
+    return entry.partition("\t")[0]
+
+
+def _clip_key(clip_item: ClipItem) -> Tuple[str, bool, float]:
+    """Identify a clipboard item together with the state its row shows."""
+    return (clip_item.id, clip_item.pinned, clip_item.timestamp)
+
+
+class ClipItemObject(GObject.Object):
+    """List model item wrapping a ClipItem."""
+
+    __gtype_name__ = "ClipNoteClipItemObject"
+
+    def __init__(self, clip_item: ClipItem):
         super().__init__()
         self.clip_item = clip_item
-        self._on_delete = on_delete
-        self._on_pin = on_pin
-
-        self.set_title(clip_item.get_display_text())
-        self.set_subtitle(clip_item.get_relative_time())
-        self.set_activatable(True)
-
-        # Icon/Thumbnail
-        if clip_item.item_type == ClipType.TEXT:
-            icon = Gtk.Image.new_from_icon_name("text-x-generic-symbolic")
-            self.add_prefix(icon)
-        elif clip_item.item_type == ClipType.FILES:
-            icon = Gtk.Image.new_from_icon_name("folder-symbolic")
-            self.add_prefix(icon)
-        else:  # IMAGE
-            if clip_item.image_path:
-                pixbuf = load_image_from_cache(clip_item.image_path)
-                if pixbuf:
-                    thumbnail = create_thumbnail(pixbuf, size=40)
-                    texture = Gdk.Texture.new_for_pixbuf(thumbnail)
-                    picture = Gtk.Picture.new_for_paintable(texture)
-                    picture.set_size_request(40, 40)
-                    picture.set_content_fit(Gtk.ContentFit.COVER)
-                    self.add_prefix(picture)
-                else:
-                    icon = Gtk.Image.new_from_icon_name("image-x-generic-symbolic")
-                    self.add_prefix(icon)
-            else:
-                icon = Gtk.Image.new_from_icon_name("image-x-generic-symbolic")
-                self.add_prefix(icon)
-
-        # Pin button
-        pin_btn = Gtk.Button()
-        pin_btn.set_icon_name("pin-symbolic" if not clip_item.pinned else "unpin-symbolic")
-        pin_btn.add_css_class("flat")
-        pin_btn.add_css_class("circular")
-        pin_btn.set_tooltip_text("Unpin" if clip_item.pinned else "Pin")
-        pin_btn.connect("clicked", self._on_pin_clicked)
-        self.add_suffix(pin_btn)
-
-        # Delete button
-        delete_btn = Gtk.Button()
-        delete_btn.set_icon_name("user-trash-symbolic")
-        delete_btn.add_css_class("flat")
-        delete_btn.add_css_class("circular")
-        delete_btn.set_tooltip_text("Delete")
-        delete_btn.connect("clicked", self._on_delete_clicked)
-        self.add_suffix(delete_btn)
-
-    def _on_delete_clicked(self, button: Gtk.Button) -> None:
-        """Handle delete button click."""
-        if self._on_delete:
-            self._on_delete(self.clip_item.id)
-
-    def _on_pin_clicked(self, button: Gtk.Button) -> None:
-        """Handle pin button click."""
-        if self._on_pin:
-            self._on_pin(self.clip_item.id)
+        # What the row shows; the item itself may be updated by a store reload
+        self.key = _clip_key(clip_item)
+
+
+class NoteObject(GObject.Object):
+    """List model item wrapping a note dict."""
+
+    __gtype_name__ = "ClipNoteNoteObject"
+
+    def __init__(self, note: dict):
+        super().__init__()
+        self.note = note
+
+
+# Size of the image thumbnails shown in clipboard rows (see clip_item_row.ui)
+ROW_THUMBNAIL_SIZE = 40
+
+# Prefix icon of clipboard rows per item type (images show a thumbnail once decoded)
+_CLIP_TYPE_ICONS = {
+    ClipType.TEXT: "text-x-generic-symbolic",
+    ClipType.FILES: "folder-symbolic",
+    ClipType.IMAGE: "image-x-generic-symbolic",
+}
+
+# Row layouts are Gtk.Builder templates shipped next to this module
+UI_DIR = Path(__file__).parent
+
+
+# Pin button icon and tooltip, indexed by the pinned state
+_PIN_ICONS = ("pin-symbolic", "unpin-symbolic")
+_PIN_TOOLTIPS = ("Pin", "Unpin")
+
+
+def _update_pin_button(button: Gtk.Button, shown: bool, pinned: bool) -> bool:
+    """Switch a row's pin button to pinned, skipping it if already shown.
+
+    Most rebinds keep the pin state, so this avoids replacing the icon and
+    tooltip for nothing. Returns the new shown state.
+    """
+    if pinned != shown:
+        button.set_icon_name(_PIN_ICONS[pinned])
+        button.set_tooltip_text(_PIN_TOOLTIPS[pinned])
+    return pinned
+
+
+def _set_action_target(item_id: str, *buttons: Gtk.Button) -> None:
+    """Point a row's buttons at the item it shows."""
+    target = GLib.Variant.new_string(item_id)
+    for button in buttons:
+        button.set_action_target_value(target)
+
+
+@Gtk.Template(filename=str(UI_DIR / "clip_item_row.ui"))
+class ClipItemRow(Gtk.Grid):
+    """A row widget showing a clipboard item.
+
+    Rows are created empty by the list factory and rebound to whichever
+    item scrolls into view.
+    """
+
+    __gtype_name__ = "ClipNoteClipItemRow"
+
+    _icon = Gtk.Template.Child("icon")
+    _thumbnail = Gtk.Template.Child("thumbnail")
+    _title = Gtk.Template.Child("title")
+    _subtitle = Gtk.Template.Child("subtitle")
+    _pin_btn = Gtk.Template.Child("pin_btn")
+    _delete_btn = Gtk.Template.Child("delete_btn")
+
+    def __init__(self):
+        super().__init__()
+        self.clip_item: Optional[ClipItem] = None
+        # Pending thumbnail decode for the bound item, if any
+        self.thumbnail_future: Optional[Future] = None
+        # Pin state shown by the pin button (the templates start unpinned)
+        self._pinned = False
+        # Type icon shown by the prefix image (the template starts with none)
+        self._icon_name: Optional[str] = None
+
+    def set_item(self, clip_item: ClipItem) -> None:
+        """Show clip_item in this row."""
+        self.clip_item = clip_item
+        # The buttons activate the window's clip-pin/clip-delete actions
+        _set_action_target(clip_item.id, self._pin_btn, self._delete_btn)
+        self._title.set_text(clip_item.get_display_text())
+        self._subtitle.set_text(clip_item.get_relative_time())
+
+        icon_name = _CLIP_TYPE_ICONS[clip_item.item_type]
+        texture = None
+        if clip_item.item_type == ClipType.IMAGE and clip_item.image_path:
+            # Decoded off the UI thread if missing; see PopupWindow
+            texture = get_cached_thumbnail(clip_item.image_path, ROW_THUMBNAIL_SIZE)
+
+        # Rows are mostly rebound to items of the same type; skip the theme lookup then
+        if icon_name != self._icon_name:
+            self._icon.set_from_icon_name(icon_name)
+            self._icon_name = icon_name
+        self.show_thumbnail(texture)
+
+        self._pinned = _update_pin_button(self._pin_btn, self._pinned, clip_item.pinned)
+
+    def refresh_time(self) -> None:
+        """Update the relative timestamp of the bound item."""
+        if self.clip_item:
+            self._subtitle.set_text(self.clip_item.get_relative_time())
+
+    def show_thumbnail(self, texture: Optional[Gdk.Texture]) -> None:
+        """Show texture as the prefix, or the type icon if it is None."""
+        self._thumbnail.set_paintable(texture)
+        self._thumbnail.set_visible(texture is not None)
+        self._icon.set_visible(texture is None)
+
+    def clear(self) -> None:
+        """Drop the bound item when the row is recycled."""
+        self.clip_item = None
+        self._thumbnail.set_paintable(None)
+        if self.thumbnail_future is not None:
+            self.thumbnail_future.cancel()
+            self.thumbnail_future = None
+
+
+# Quiet time after the last keystroke before the current tab is refiltered
+SEARCH_DEBOUNCE_MS = 100
+
+# How often the relative times of the rows in view are updated while open
+TIME_REFRESH_SECONDS = 30
+
+# Copies of the same thing closer together than this (e.g. a double-click
+# followed by Enter) are dropped instead of taking the clipboard again
+REPEAT_COPY_INTERVAL = 0.25
+
+
+# Header state per tab, in Tab key cycling order
+TAB_SPECS = {
+    "clipboard": {"placeholder": "Search clipboard...", "show_clear": True, "show_add_note": False},
+    "notes": {"placeholder": "Search notes...", "show_clear": False, "show_add_note": True},
+    "emojis": {"placeholder": "Search emojis...", "show_clear": False, "show_add_note": False},
+}
+
+# Icon, title and description of the empty state pages, built on first use
+EMPTY_PAGES = {
+    "clipboard": ("edit-paste-symbolic", "No Clipboard History", "Copy something to get started"),
+    "notes": ("notepad-symbolic", "No Notes Yet", "Click + to create a quick note"),
+}
 
 
 # Note color palette
@@ -102,78 +211,101 @@ NOTE_COLORS = {
     'purple': '#9141ac',
 }
 
-
-class NoteRow(Adw.ActionRow):
-    """A row widget representing a single note."""
-
-    def __init__(
-        self,
-        note: dict,
-        on_delete: Optional[Callable[[str], None]] = None,
-        on_edit: Optional[Callable[[dict], None]] = None,
-        on_pin: Optional[Callable[[str], None]] = None,
-    ):
+# Color names and their CSS classes, computed once instead of per row/dialog
+_COLOR_NAMES = tuple(NOTE_COLORS)
+_NOTE_ICON_CLASSES = {c: f"note-icon-{c}" for c in _COLOR_NAMES}
+_COLOR_BTN_CLASSES = {c: f"color-btn-{c}" for c in _COLOR_NAMES}
+_COLOR_TOOLTIPS = {c: c.capitalize() for c in _COLOR_NAMES}
+
+
+def _note_sort_key(note: dict) -> Tuple[bool, float]:
+    """Sort key matching the database order (pinned first, then newest)."""
+    return (not note.get("pinned"), -note.get("timestamp", 0))
+
+
+def _note_key(note: dict) -> Tuple[Any, ...]:
+    """Identify a note together with everything its row shows."""
+    return (
+        note.get("id"),
+        bool(note.get("pinned")),
+        note.get("timestamp"),
+        note.get("color"),
+        note.get("title"),
+        note.get("body"),
+    )
+
+
+def _splice_changes(
+    model: Gio.ListStore,
+    old_keys: List[Any],
+    items: List[Any],
+    new_keys: List[Any],
+    wrap: Callable[[Any], GObject.Object],
+    batch: bool
+) -> None:
+    """Update model (whose items have old_keys) to items with minimal splices.
+
+    Runs of unchanged items keep their model objects (and bound rows);
+    each changed run is one splice. Applied back to front so earlier
+    positions stay valid. With batch, used while the list isn't mapped,
+    the span from the first to the last change is replaced in a single
+    splice instead, so the list handles one items-changed.
+    """
+    matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    changes = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+    if not changes:
+        return
+
+    if batch:
+        changes = [("replace", changes[0][1], changes[-1][2], changes[0][3], changes[-1][4])]
+    for tag, old_start, old_end, new_start, new_end in reversed(changes):
+        model.splice(old_start, old_end - old_start, [wrap(item) for item in items[new_start:new_end]])
+
+
+@Gtk.Template(filename=str(UI_DIR / "note_row.ui"))
+class NoteRow(Gtk.Grid):
+    """A row widget showing a note, rebound as the list scrolls."""
+
+    __gtype_name__ = "ClipNoteNoteRow"
+
+    _color_icon = Gtk.Template.Child("color_icon")
+    _title = Gtk.Template.Child("title")
+    _subtitle = Gtk.Template.Child("subtitle")
+    _pin_btn = Gtk.Template.Child("pin_btn")
+    _edit_btn = Gtk.Template.Child("edit_btn")
+    _delete_btn = Gtk.Template.Child("delete_btn")
+
+    def __init__(self):
         super().__init__()
+        self.note: Optional[dict] = None
+        # Pin state shown by the pin button (the templates start unpinned)
+        self._pinned = False
+        # Color class the template starts the icon with
+        self._color_class = _NOTE_ICON_CLASSES["blue"]
+
+    def set_note(self, note: dict) -> None:
+        """Show note in this row."""
         self.note = note
-        self._on_delete = on_delete
-        self._on_edit = on_edit
-        self._on_pin = on_pin
-
-        self.set_title(note.get("title", "Untitled"))
-        self.set_activatable(True)
-
-        # Body preview
-        body = note.get("body", "")
-        preview_length = 100
-        body_preview = body[:preview_length].replace("\n", " ")
-        if len(body) > preview_length:
-            body_preview += "..."
-        self.set_subtitle(body_preview)
-
-        # Color indicator (Icon)
-        color = note.get("color", "blue") or "blue"
-        icon = Gtk.Image.new_from_icon_name("notepad-symbolic")
-        icon.add_css_class(f"note-icon-{color}")
-        self.add_prefix(icon)
-
-        # Edit button
-        edit_btn = Gtk.Button()
-        edit_btn.set_icon_name("document-edit-symbolic")
-        edit_btn.add_css_class("flat")
-        edit_btn.add_css_class("circular")
-        edit_btn.set_tooltip_text("Edit")
-        edit_btn.connect("clicked", self._on_edit_clicked)
-        self.add_suffix(edit_btn)
-
-        # Pin button
-        pin_btn = Gtk.Button()
-        pin_btn.set_icon_name("pin-symbolic" if not note.get("pinned") else "unpin-symbolic")
-        pin_btn.add_css_class("flat")
-        pin_btn.add_css_class("circular")
-        pin_btn.set_tooltip_text("Unpin" if note.get("pinned") else "Pin")
-        pin_btn.connect("clicked", self._on_pin_clicked)
-        self.add_suffix(pin_btn)
-
-        # Delete button
-        delete_btn = Gtk.Button()
-        delete_btn.set_icon_name("user-trash-symbolic")
-        delete_btn.add_css_class("flat")
-        delete_btn.add_css_class("circular")
-        delete_btn.set_tooltip_text("Delete")
-        delete_btn.connect("clicked", self._on_delete_clicked)
-        self.add_suffix(delete_btn)
-
-    def _on_delete_clicked(self, button: Gtk.Button) -> None:
-        if self._on_delete:
-            self._on_delete(self.note["id"])
-
-    def _on_pin_clicked(self, button: Gtk.Button) -> None:
-        if self._on_pin:
-            self._on_pin(self.note["id"])
-
-    def _on_edit_clicked(self, button: Gtk.Button) -> None:
-        if self._on_edit:
-            self._on_edit(self.note)
+        # The buttons activate the window's note-edit/pin/delete actions
+        _set_action_target(note["id"], self._edit_btn, self._pin_btn, self._delete_btn)
+        self._title.set_text(note.get("title", "Untitled"))
+        # Body preview (precomputed by the database on write)
+        self._subtitle.set_text(note.get("preview") or "")
+        self.set_color(note.get("color", "blue") or "blue")
+        self._pinned = _update_pin_button(self._pin_btn, self._pinned, bool(note.get("pinned")))
+
+    def clear(self) -> None:
+        """Drop the bound note when the row is recycled."""
+        self.note = None
+
+    def set_color(self, color: str) -> None:
+        """Swap the color indicator class without touching the other colors."""
+        new_class = _NOTE_ICON_CLASSES.get(color, _NOTE_ICON_CLASSES["blue"])
+        if new_class == self._color_class:
+            return
+        self._color_icon.remove_css_class(self._color_class)
+        self._color_icon.add_css_class(new_class)
+        self._color_class = new_class
 
 
 class PopupWindow(Adw.ApplicationWindow):
@@ -191,17 +323,66 @@ class PopupWindow(Adw.ApplicationWindow):
         self.db = database or Database()
         self.config_manager = config_manager or ConfigManager()
         self.clipboard = Gdk.Display.get_default().get_clipboard()
+
+        # Normally already installed in do_startup; this is a no-op then
+        ensure_css(self.get_display())
         self._current_filter = ""
         self._current_tab = "clipboard"
+        self._note_objects: Dict[str, NoteObject] = {}
+
+        # Store version the clipboard model was filled from, and the rows
+        # currently showing an item (only those in view)
+        self._populated_version = -1
+        self._bound_clip_rows: Set[ClipItemRow] = set()
+
+        # Decodes row thumbnails so image-heavy histories don't block the UI
+        self._thumbnail_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="clipnote-thumbnail")
+        # Saves from the note dialog, one at a time and in order
+        self._note_write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clipnote-note-write")
+        # Runs list queries (see _run_in_background)
+        self._query_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clipnote-query")
+        self._search_timeout_id = 0
+        self._store_refresh_id = 0
+        self._notes_refresh_id = 0
+        self._time_refresh_id = 0
+        # What was last put on the clipboard, and when (time.monotonic)
+        self._last_copy: Tuple[str, float] = ("", 0.0)
+
+        # Bumped per query so results of superseded background queries are dropped
+        self._notes_query_gen = 0
+
+        # Database notes version the notes model matches; writes the model
+        # doesn't apply itself leave it behind, so the next populate reloads
+        self._notes_version = -1
+        # Database notes version being read by a background load, if any
+        self._notes_loading_version = -1
+
+        # Built on first open, then hidden and reused
+        self._settings_dialog = None
+
+        # Note dialog, built on first open (see _ensure_note_dialog), and the
+        # note it is editing (None for a new note)
+        self._note_dialog: Optional[Adw.MessageDialog] = None
+        self._note_color_buttons: Dict[str, Gtk.ToggleButton] = {}
+        self._dialog_note: Optional[dict] = None
+        self._dialog_color = "blue"
+        self._dialog_initial_color = "blue"
 
         # Hotkey info (set by main.py after creation)
         self.hotkey_backend_name: Optional[str] = None
         self.hotkey_registered: bool = False
 
+        # Brings a tab's list up to date with the search text when shown
+        self._tab_refresh: Dict[str, Callable[[], None]] = {
+            "clipboard": self._filter_clip_items,
+            "notes": self._populate_notes_list,
+            "emojis": self._filter_emojis,
+        }
+
         self._build_ui()
+        self._setup_actions()
         self._setup_keyboard()
         self._populate_list()
-        self._populate_emoji_list()
 
         # Listen for store changes
         self.store.add_listener(self._on_store_changed)
@@ -214,6 +395,7 @@ class PopupWindow(Adw.ApplicationWindow):
         self.set_title("ClipNote")
         self.set_default_size(550, 600)
         self.set_hide_on_close(True)
+        self.connect("close-request", self._on_close_request)
         self.add_css_class("clipnote-window")
 
         # Main vertical box
@@ -223,22 +405,24 @@ class PopupWindow(Adw.ApplicationWindow):
         header = Adw.HeaderBar()
         header.set_show_end_title_buttons(True)
 
+        # Header buttons get their properties in the constructor, in one go
         # Clear all button (clipboard tab)
-        self.clear_btn = Gtk.Button()
-        self.clear_btn.set_icon_name("user-trash-symbolic")
-        self.clear_btn.set_tooltip_text("Clear all (keep pinned)")
-        self.clear_btn.add_css_class("flat")
+        self.clear_btn = Gtk.Button(
+            icon_name="user-trash-symbolic",
+            tooltip_text="Clear all (keep pinned)",
+            css_classes=["flat"],
+        )
         self.clear_btn.connect("clicked", self._on_clear_all_clicked)
         header.pack_start(self.clear_btn)
 
         # Add note button (notes tab)
-        self.add_note_btn = Gtk.Button()
-        self.add_note_btn.set_icon_name("list-add-symbolic")
-        self.add_note_btn.set_tooltip_text("Add new note")
-        self.add_note_btn.add_css_class("flat")
-        self.add_note_btn.add_css_class("suggested-action")
+        self.add_note_btn = Gtk.Button(
+            icon_name="list-add-symbolic",
+            tooltip_text="Add new note",
+            css_classes=["flat", "suggested-action"],
+            visible=False,
+        )
         self.add_note_btn.connect("clicked", self._on_add_note_clicked)
-        self.add_note_btn.set_visible(False)
         header.pack_start(self.add_note_btn)
 
         # Search entry
@@ -247,23 +431,28 @@ class PopupWindow(Adw.ApplicationWindow):
         self.search_entry.set_hexpand(True)
         self.search_entry.set_max_width_chars(40)
         self.search_entry.add_css_class("search-entry")
+        # Keystrokes are coalesced by _on_search_changed instead
+        self.search_entry.set_search_delay(0)
         self.search_entry.connect("search-changed", self._on_search_changed)
         header.set_title_widget(self.search_entry)
 
         # Private mode indicator (end of header)
-        self.private_mode_btn = Gtk.ToggleButton()
-        self.private_mode_btn.set_icon_name("security-high-symbolic")
-        self.private_mode_btn.set_tooltip_text("Private Mode (pauses clipboard monitoring)")
-        self.private_mode_btn.add_css_class("flat")
-        self.private_mode_btn.set_active(self.config_manager.config.private_mode)
+        self._private_mode_shown = self.config_manager.config.private_mode
+        self.private_mode_btn = Gtk.ToggleButton(
+            icon_name="security-high-symbolic",
+            tooltip_text="Private Mode (pauses clipboard monitoring)",
+            css_classes=["flat", "warning"] if self._private_mode_shown else ["flat"],
+            active=self._private_mode_shown,
+        )
         self.private_mode_btn.connect("toggled", self._on_private_mode_toggled)
         header.pack_end(self.private_mode_btn)
 
         # Settings button (end of header)
-        settings_btn = Gtk.Button()
-        settings_btn.set_icon_name("emblem-system-symbolic")
-        settings_btn.set_tooltip_text("Settings")
-        settings_btn.add_css_class("flat")
+        settings_btn = Gtk.Button(
+            icon_name="emblem-system-symbolic",
+            tooltip_text="Settings",
+            css_classes=["flat"],
+        )
         settings_btn.connect("clicked", self._on_settings_clicked)
         header.pack_end(settings_btn)
 
@@ -281,32 +470,35 @@ class PopupWindow(Adw.ApplicationWindow):
         clip_scrolled.set_vexpand(True)
         clip_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
-        self.listbox = Gtk.ListBox()
-        self.listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.listbox.set_activate_on_single_click(False)
-        self.listbox.add_css_class("boxed-list")
-        self.listbox.set_margin_top(12)
-        self.listbox.set_margin_bottom(12)
-        self.listbox.set_margin_start(12)
-        self.listbox.set_margin_end(12)
-        self.listbox.connect("row-activated", self._on_row_activated)
-        gesture = Gtk.GestureClick()
-        gesture.set_button(1)
-        gesture.connect("pressed", self._on_list_click)
-        self.listbox.add_controller(gesture)
-        clip_scrolled.set_child(self.listbox)
-
-        # Empty state for clipboard
-        self.clip_empty = Adw.StatusPage()
-        self.clip_empty.set_icon_name("edit-paste-symbolic")
-        self.clip_empty.set_title("No Clipboard History")
-        self.clip_empty.set_description("Copy something to get started")
-
+        # Only the rows in view are realized; they are rebound while scrolling
+        # Search filters the model in place instead of refilling it
+        self._clip_model = Gio.ListStore.new(ClipItemObject)
+        self._clip_query = ""
+        # No match function while the query is empty (see _refilter)
+        self._clip_filter = Gtk.CustomFilter.new(None)
+        self._clip_filtered = Gtk.FilterListModel.new(self._clip_model, self._clip_filter)
+        self._clip_filtered.connect("items-changed", self._on_clip_items_changed)
+        self._clip_selection = Gtk.SingleSelection.new(self._clip_filtered)
+
+        clip_factory = Gtk.SignalListItemFactory()
+        clip_factory.connect("setup", self._on_clip_item_setup)
+        clip_factory.connect("bind", self._on_clip_item_bind)
+        clip_factory.connect("unbind", self._on_clip_item_unbind)
+
+        self.clip_list = Gtk.ListView.new(self._clip_selection, clip_factory)
+        self.clip_list.add_css_class("clip-list")
+        self.clip_list.set_margin_top(12)
+        self.clip_list.set_margin_bottom(12)
+        self.clip_list.set_margin_start(12)
+        self.clip_list.set_margin_end(12)
+        # Double-click or Enter on a row pastes it
+        self.clip_list.connect("activate", self._on_row_activated)
+        clip_scrolled.set_child(self.clip_list)
+
+        # The empty state page is only added once the list is first empty
         self.clip_stack = Gtk.Stack()
         self.clip_stack.set_vexpand(True)
         self.clip_stack.add_named(clip_scrolled, "list")
-        self.clip_stack.add_named(self.clip_empty, "empty")
-        self.clip_stack.set_visible_child_name("empty")
 
         clipboard_box.append(self.clip_stack)
 
@@ -321,32 +513,32 @@ class PopupWindow(Adw.ApplicationWindow):
         notes_scrolled.set_vexpand(True)
         notes_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
-        self.notes_listbox = Gtk.ListBox()
-        self.notes_listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.notes_listbox.set_activate_on_single_click(False)
-        self.notes_listbox.add_css_class("boxed-list")
-        self.notes_listbox.set_margin_top(12)
-        self.notes_listbox.set_margin_bottom(12)
-        self.notes_listbox.set_margin_start(12)
-        self.notes_listbox.set_margin_end(12)
-        self.notes_listbox.connect("row-activated", self._on_note_row_activated)
-        notes_gesture = Gtk.GestureClick()
-        notes_gesture.set_button(1)
-        notes_gesture.connect("pressed", self._on_notes_list_click)
-        self.notes_listbox.add_controller(notes_gesture)
-        notes_scrolled.set_child(self.notes_listbox)
-
-        # Empty state for notes
-        self.notes_empty = Adw.StatusPage()
-        self.notes_empty.set_icon_name("notepad-symbolic")
-        self.notes_empty.set_title("No Notes Yet")
-        self.notes_empty.set_description("Click + to create a quick note")
+        self._notes_model = Gio.ListStore.new(NoteObject)
+        self._notes_query = ""
+        self._notes_filter = Gtk.CustomFilter.new(None)
+        self._notes_filtered = Gtk.FilterListModel.new(self._notes_model, self._notes_filter)
+        self._notes_filtered.connect("items-changed", self._on_notes_items_changed)
+        self._notes_selection = Gtk.SingleSelection.new(self._notes_filtered)
+
+        notes_factory = Gtk.SignalListItemFactory()
+        notes_factory.connect("setup", self._on_note_item_setup)
+        notes_factory.connect("bind", self._on_note_item_bind)
+        notes_factory.connect("unbind", self._on_note_item_unbind)
+
+        self.notes_list = Gtk.ListView.new(self._notes_selection, notes_factory)
+        self.notes_list.add_css_class("clip-list")
+        self.notes_list.set_margin_top(12)
+        self.notes_list.set_margin_bottom(12)
+        self.notes_list.set_margin_start(12)
+        self.notes_list.set_margin_end(12)
+        self.notes_list.connect("activate", self._on_note_row_activated)
+        notes_scrolled.set_child(self.notes_list)
 
         self.notes_stack = Gtk.Stack()
         self.notes_stack.set_vexpand(True)
         self.notes_stack.add_named(notes_scrolled, "list")
-        self.notes_stack.add_named(self.notes_empty, "empty")
-        self.notes_stack.set_visible_child_name("empty")
+        self.notes_stack.add_named(self._build_loading_page(), "loading")
+        self.notes_stack.set_visible_child_name("loading")
 
         notes_box.append(self.notes_stack)
 
@@ -358,21 +550,37 @@ class PopupWindow(Adw.ApplicationWindow):
         emoji_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         emoji_scrolled = Gtk.ScrolledWindow()
         emoji_scrolled.set_vexpand(True)
-
-        self.emoji_flowbox = Gtk.FlowBox()
-        self.emoji_flowbox.set_valign(Gtk.Align.START)
-        self.emoji_flowbox.set_max_children_per_line(10)
-        self.emoji_flowbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.emoji_flowbox.set_homogeneous(True)
-        self.emoji_flowbox.set_column_spacing(4)
-        self.emoji_flowbox.set_row_spacing(4)
-        self.emoji_flowbox.add_css_class("emoji-flowbox")
-        self.emoji_flowbox.set_margin_start(12)
-        self.emoji_flowbox.set_margin_end(12)
-        self.emoji_flowbox.set_margin_top(12)
-        self.emoji_flowbox.set_margin_bottom(12)
-
-        emoji_scrolled.set_child(self.emoji_flowbox)
+        emoji_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+
+        # Only the cells in view are realized; filtering runs over the model
+        # Filled when the tab is first shown (see _filter_emojis)
+        # Entries are plain strings matched by a StringFilter, so searching
+        # the emoji table runs entirely in GTK without calling into Python
+        self._emoji_model = Gtk.StringList()
+        self._emoji_loaded = False
+        self._emoji_filter = Gtk.StringFilter.new(
+            Gtk.PropertyExpression.new(Gtk.StringObject, None, "string")
+        )
+        self._emoji_filter.set_match_mode(Gtk.StringFilterMatchMode.SUBSTRING)
+        self._emoji_filter.set_ignore_case(True)
+        emoji_filter_model = Gtk.FilterListModel.new(self._emoji_model, self._emoji_filter)
+
+        emoji_factory = Gtk.SignalListItemFactory()
+        emoji_factory.connect("setup", self._on_emoji_item_setup)
+        emoji_factory.connect("bind", self._on_emoji_item_bind)
+
+        self.emoji_grid = Gtk.GridView.new(Gtk.NoSelection.new(emoji_filter_model), emoji_factory)
+        self.emoji_grid.set_max_columns(10)
+        # One handler for the whole grid instead of one per cell
+        self.emoji_grid.set_single_click_activate(True)
+        self.emoji_grid.connect("activate", self._on_emoji_activated)
+        self.emoji_grid.add_css_class("emoji-grid")
+        self.emoji_grid.set_margin_start(12)
+        self.emoji_grid.set_margin_end(12)
+        self.emoji_grid.set_margin_top(12)
+        self.emoji_grid.set_margin_bottom(12)
+
+        emoji_scrolled.set_child(self.emoji_grid)
         emoji_box.append(emoji_scrolled)
 
         page = self.content_stack.add_named(emoji_box, "emojis")
@@ -389,6 +597,33 @@ class PopupWindow(Adw.ApplicationWindow):
 
         self.set_content(main_box)
 
+    def _build_loading_page(self) -> Gtk.Widget:
+        """Build the placeholder shown while a list query is running."""
+        spinner = Gtk.Spinner()
+        spinner.set_size_request(32, 32)
+        spinner.set_halign(Gtk.Align.CENTER)
+        spinner.set_valign(Gtk.Align.CENTER)
+        spinner.start()
+        return spinner
+
+    def _setup_actions(self) -> None:
+        """Add the window actions the row buttons activate.
+
+        Each takes the id of the row's item as its target, so the rows
+        themselves connect no handlers.
+        """
+        handlers = {
+            "clip-pin": self._pin_item,
+            "clip-delete": self._delete_item,
+            "note-edit": self._edit_note,
+            "note-pin": self._pin_note,
+            "note-delete": self._delete_note,
+        }
+        for name, handler in handlers.items():
+            action = Gio.SimpleAction.new(name, GLib.VariantType.new("s"))
+            action.connect("activate", lambda _action, target, handler=handler: handler(target.get_string()))
+            self.add_action(action)
+
     def _setup_keyboard(self) -> None:
         """Set up keyboard shortcuts."""
         controller = Gtk.EventControllerKey()
@@ -402,27 +637,27 @@ class PopupWindow(Adw.ApplicationWindow):
             return True
         elif keyval == Gdk.KEY_Return or keyval == Gdk.KEY_KP_Enter:
             if self._current_tab == "clipboard":
-                selected_row = self.listbox.get_selected_row()
-                if selected_row and hasattr(selected_row, "clip_item"):
-                    self._restore_item(selected_row.clip_item)
+                selected = self._clip_selection.get_selected_item()
+                if selected is not None:
+                    self._restore_item(selected.clip_item)
             else:
-                selected_row = self.notes_listbox.get_selected_row()
-                if selected_row and hasattr(selected_row, "note"):
-                    self._copy_note_to_clipboard(selected_row.note)
+                selected = self._notes_selection.get_selected_item()
+                if selected is not None:
+                    self._copy_note_to_clipboard(selected.note)
             return True
         elif keyval == Gdk.KEY_Delete:
             if self._current_tab == "clipboard":
-                selected_row = self.listbox.get_selected_row()
-                if selected_row and hasattr(selected_row, "clip_item"):
-                    self._delete_item(selected_row.clip_item.id)
+                selected = self._clip_selection.get_selected_item()
+                if selected is not None:
+                    self._delete_item(selected.clip_item.id)
             else:
-                selected_row = self.notes_listbox.get_selected_row()
-                if selected_row and hasattr(selected_row, "note"):
-                    self._delete_note(selected_row.note["id"])
+                selected = self._notes_selection.get_selected_item()
+                if selected is not None:
+                    self._delete_note(selected.note["id"])
             return True
         elif keyval == Gdk.KEY_Tab:
             # We can use the view stack to switch pages
-            pages = ["clipboard", "notes", "emojis"]
+            pages = list(TAB_SPECS)
             try:
                 idx = pages.index(self._current_tab)
                 next_idx = (idx + 1) % len(pages)
@@ -432,25 +667,86 @@ class PopupWindow(Adw.ApplicationWindow):
             return True
         return False
 
-    def _on_list_click(self, gesture: Gtk.GestureClick, n_press: int, x: float, y: float) -> None:
-        """Handle click on list - double-click to paste."""
-        if n_press == 2:
-            selected_row = self.listbox.get_selected_row()
-            if selected_row and hasattr(selected_row, "clip_item"):
-                self._restore_item(selected_row.clip_item)
-
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
-        """Handle search text changes."""
-        self._current_filter = entry.get_text()
-        if self._current_tab == "clipboard":
-            self._populate_list()
-        elif self._current_tab == "notes":
-            self._populate_notes_list()
-        elif self._current_tab == "emojis":
-            self._filter_emojis()
+        """Handle search text changes, coalescing bursts of keystrokes."""
+        self._cancel_pending_search()
+        if not entry.get_text():
+            # Clearing the entry is a single action; show everything right away
+            self._apply_search()
+            return
+        self._search_timeout_id = GLib.timeout_add(SEARCH_DEBOUNCE_MS, self._apply_search)
+
+    def _cancel_pending_search(self) -> None:
+        """Drop a search that is still waiting for its debounce timeout."""
+        if self._search_timeout_id:
+            GLib.source_remove(self._search_timeout_id)
+            self._search_timeout_id = 0
+
+    def _apply_search(self) -> bool:
+        """Refilter the current tab with the search entry text."""
+        self._search_timeout_id = 0
+        self._current_filter = self.search_entry.get_text()
+        self._tab_refresh[self._current_tab]()
+        return GLib.SOURCE_REMOVE
+
+    def _on_close_request(self, window: Gtk.Window) -> bool:
+        """Cancel pending work when the window is hidden."""
+        self._cancel_pending_search()
+        if self._time_refresh_id:
+            GLib.source_remove(self._time_refresh_id)
+            self._time_refresh_id = 0
+        return False
+
+    def _on_row_activated(self, list_view: Gtk.ListView, position: int) -> None:
+        """Paste the activated clipboard item."""
+        obj = self._clip_selection.get_item(position)
+        if obj is not None:
+            self._restore_item(obj.clip_item)
+
+    def _on_clip_item_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Create the row widget reused by a list item."""
+        list_item.set_child(ClipItemRow())
+
+    def _on_clip_item_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Show the bound clipboard item on a recycled row."""
+        row = list_item.get_child()
+        clip_item = list_item.get_item().clip_item
+        row.set_item(clip_item)
+        self._bound_clip_rows.add(row)
+        if (
+            clip_item.item_type == ClipType.IMAGE
+            and clip_item.image_path
+            and get_cached_thumbnail(clip_item.image_path, ROW_THUMBNAIL_SIZE) is None
+        ):
+            self._load_row_thumbnail(row, clip_item)
+
+    def _load_row_thumbnail(self, row: ClipItemRow, clip_item: ClipItem) -> None:
+        """Decode the thumbnail of an image row on the thumbnail pool."""
+        future = self._thumbnail_pool.submit(decode_thumbnail, clip_item.image_path, ROW_THUMBNAIL_SIZE)
+        row.thumbnail_future = future
+        future.add_done_callback(
+            lambda done: GLib.idle_add(self._apply_row_thumbnail, row, clip_item, done)
+        )
 
-    def _on_row_activated(self, listbox: Gtk.ListBox, row) -> None:
-        pass
+    def _apply_row_thumbnail(self, row: ClipItemRow, clip_item: ClipItem, future: Future) -> bool:
+        """Idle callback showing a decoded thumbnail if the row still shows its item."""
+        if future.cancelled():
+            return GLib.SOURCE_REMOVE
+        if row.thumbnail_future is future:
+            row.thumbnail_future = None
+
+        thumbnail = future.result()
+        if thumbnail is not None:
+            texture = cache_thumbnail(clip_item.image_path, ROW_THUMBNAIL_SIZE, thumbnail)
+            if row.clip_item is clip_item:
+                row.show_thumbnail(texture)
+        return GLib.SOURCE_REMOVE
+
+    def _on_clip_item_unbind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Release the item of a row that scrolled out of view."""
+        row = list_item.get_child()
+        row.clear()
+        self._bound_clip_rows.discard(row)
 
     def _delete_item(self, item_id: str) -> None:
         """Delete an item from the store."""
@@ -464,164 +760,403 @@ class PopupWindow(Adw.ApplicationWindow):
         """Clear all non-pinned items."""
         self.store.clear(keep_pinned=True)
 
+    def _is_repeat_copy(self, key: str) -> bool:
+        """Record a copy of key, returning True if it just repeats the last one."""
+        now = time.monotonic()
+        last_key, last_time = self._last_copy
+        self._last_copy = (key, now)
+        return key == last_key and now - last_time < REPEAT_COPY_INTERVAL
+
     def _restore_item(self, item: ClipItem) -> None:
         """Copy item back to clipboard."""
+        if self._is_repeat_copy(f"clip:{item.id}"):
+            return
         try:
             if item.item_type == ClipType.TEXT and item.text_content:
                 content = Gdk.ContentProvider.new_for_value(item.text_content)
                 self.clipboard.set_content(content)
             elif item.item_type == ClipType.IMAGE and item.image_path:
-                pixbuf = load_image_from_cache(item.image_path)
-                if pixbuf:
-                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                texture = get_image_texture(item.image_path)
+                if texture is not None:
                     content = Gdk.ContentProvider.new_for_value(texture)
                     self.clipboard.set_content(content)
             elif item.item_type == ClipType.FILES and item.file_uris:
-                files = [Gio.File.new_for_uri(uri) for uri in item.file_uris]
-                file_list = Gdk.FileList.new_from_list(files)
-                content = Gdk.ContentProvider.new_for_value(file_list)
-                self.clipboard.set_content(content)
+                self.clipboard.set_content(_file_list_content(tuple(item.file_uris)))
         except Exception as e:
             print(f"Error restoring item: {e}")
 
         self.close()
 
     def _populate_list(self) -> None:
-        """Populate the list with items from store."""
-        while True:
-            row = self.listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.listbox.remove(row)
-
-        if self._current_filter:
-            items = self.store.search_items(self._current_filter)
-        else:
-            items = self.store.get_all_items()
+        """Fill the clipboard model with the items from store.
+
+        The model always holds the whole history; the search query is
+        applied by the filter model on top of it. An empty model is filled
+        in one splice: that is the first fill, made before the window is
+        shown, or a refill after clearing, which starts small. Later
+        updates only splice in what changed; while the list isn't mapped
+        nothing is drawn, so changes then go in as a single splice.
+        """
+        self._populated_version = self.store.version
+
+        items = self.store.get_all_items()
+        if self._clip_model.get_n_items():
+            self._splice_clip_changes(items)
+            self._clip_selection.set_selected(0)
+            return
+
+        if not items:
+            # items-changed isn't emitted when both old and new lists are empty
+            self._on_clip_items_changed(self._clip_filtered, 0, 0, 0)
+            return
+
+        self._clip_model.splice(0, 0, [ClipItemObject(item) for item in items])
+        self._clip_selection.set_selected(0)
+
+    def _splice_clip_changes(self, items: List[ClipItem]) -> None:
+        """Update the clipboard model to items with minimal splices."""
+        model = self._clip_model
+        _splice_changes(
+            model,
+            [model.get_item(i).key for i in range(model.get_n_items())],
+            items,
+            [_clip_key(item) for item in items],
+            ClipItemObject,
+            batch=not self.clip_list.get_mapped()
+        )
 
-        for item in items:
-            row = ClipItemRow(item, on_delete=self._delete_item, on_pin=self._pin_item)
-            self.listbox.append(row)
+    def _clip_match(self, obj: ClipItemObject) -> bool:
+        """Filter function for the clipboard model."""
+        return self._clip_query in obj.clip_item.search_text
 
-        if len(items) == 0:
-            self.clip_stack.set_visible_child_name("empty")
+    def _filter_clip_items(self) -> None:
+        """Apply the search query to the clipboard model."""
+        previous, self._clip_query = self._clip_query, self._current_filter.lower()
+        if self._refilter(self._clip_filter, self._clip_match, previous, self._clip_query):
+            self._clip_selection.set_selected(0)
+
+    def _refilter(
+        self,
+        custom_filter: Gtk.CustomFilter,
+        match: Callable[[GObject.Object], bool],
+        previous: str,
+        query: str
+    ) -> bool:
+        """Apply a query change to one of the list filters.
+
+        An empty query removes the match function: the filter then matches
+        everything and the filter model passes items through without
+        calling back into Python. Returns False if the query is unchanged.
+        """
+        change = self._filter_change(previous, query)
+        if change is None:
+            return False
+        if not query:
+            custom_filter.set_filter_func(None)
+        elif not previous:
+            custom_filter.set_filter_func(match)
         else:
-            self.clip_stack.set_visible_child_name("list")
-            first_row = self.listbox.get_row_at_index(0)
-            if first_row:
-                self.listbox.select_row(first_row)
+            custom_filter.changed(change)
+        return True
+
+    @staticmethod
+    def _filter_change(previous: str, query: str) -> Optional[Gtk.FilterChange]:
+        """Classify a query change so only affected items are re-checked.
+
+        Extending the query only needs the current matches re-checked, and
+        shortening it only the hidden ones. Returns None if unchanged.
+        """
+        if query == previous:
+            return None
+        if query.startswith(previous):
+            return Gtk.FilterChange.MORE_STRICT
+        if previous.startswith(query):
+            return Gtk.FilterChange.LESS_STRICT
+        return Gtk.FilterChange.DIFFERENT
+
+    def _on_clip_items_changed(self, model: Gio.ListModel, position: int, removed: int, added: int) -> None:
+        """Show the empty state whenever nothing passes the filter."""
+        self._show_list_or_empty(self.clip_stack, "clipboard", model.get_n_items() > 0)
+
+    def _show_list_or_empty(self, stack: Gtk.Stack, tab: str, has_items: bool) -> None:
+        """Show a tab's list, or its empty state page (built on first use)."""
+        if has_items:
+            stack.set_visible_child_name("list")
+            return
+        if stack.get_child_by_name("empty") is None:
+            icon_name, title, description = EMPTY_PAGES[tab]
+            stack.add_named(
+                Adw.StatusPage(icon_name=icon_name, title=title, description=description),
+                "empty"
+            )
+        stack.set_visible_child_name("empty")
+
+    def _run_in_background(
+        self,
+        query: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None]
+    ) -> None:
+        """Run a database query on the query pool.
+
+        on_done is called with the result on the main loop, or on_error
+        with the exception if the query raised. Each database call opens
+        its own connection, so queries are safe off the UI thread.
+        """
+        def deliver(future: Future) -> bool:
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
+            else:
+                on_error(error)
+            return GLib.SOURCE_REMOVE
+
+        future = self._query_pool.submit(query)
+        future.add_done_callback(lambda done: GLib.idle_add(deliver, done))
 
     def _on_store_changed(self) -> None:
-        """Handle store updates."""
+        """Handle store updates, refreshing at most once per main loop iteration.
+
+        While the window is hidden nothing is refreshed; present() catches
+        up from the store version instead.
+        """
+        if not self.get_visible():
+            return
+        if not self._store_refresh_id:
+            self._store_refresh_id = GLib.idle_add(self._refresh_from_store)
+
+    def _refresh_from_store(self) -> bool:
+        """Idle callback repopulating the list after store changes."""
+        self._store_refresh_id = 0
         self._populate_list()
+        return GLib.SOURCE_REMOVE
 
     def present(self) -> None:
         """Show the window and focus search."""
+        # Caught up before mapping, so it goes in as one batch (see _populate_list)
+        if self.store.version != self._populated_version:
+            self._populate_list()
+        # Always reopen on the newest clip, so hotkey + Enter pastes it
+        self._clip_selection.set_selected(0)
+        self.clip_list.get_vadjustment().set_value(0)
         super().present()
         self.search_entry.grab_focus()
-        self._populate_list()
+        # Rows kept across updates still show the time they were bound at
+        self._refresh_row_times()
+        if not self._time_refresh_id:
+            self._time_refresh_id = GLib.timeout_add_seconds(
+                TIME_REFRESH_SECONDS,
+                self._refresh_row_times
+            )
         if self._current_tab == "notes":
             self._populate_notes_list()
 
+    def refresh_notes(self) -> None:
+        """Bring the notes list up to date after notes changed outside the window.
+
+        Reloads at idle if the notes tab is showing; otherwise the next
+        populate (on present or tab switch) picks up the change.
+        """
+        self._schedule_notes_refresh()
+
+    def _refresh_row_times(self) -> bool:
+        """Update the relative times of the clipboard rows in view.
+
+        Only the bound rows are touched; the rest get the current time when
+        they are bound. Also the timeout callback while the window is open.
+        """
+        for row in self._bound_clip_rows:
+            row.refresh_time()
+        return GLib.SOURCE_CONTINUE
+
     # ===== TAB SWITCHING =====
 
     def _on_tab_changed(self, stack: Adw.ViewStack, param) -> None:
         """Handle tab switching."""
         name = stack.get_visible_child_name()
+        if name == self._current_tab:
+            return
         self._current_tab = name
 
         # Update UI state based on tab
-        if name == "clipboard":
-            self.search_entry.set_placeholder_text("Search clipboard...")
-            self.clear_btn.set_visible(True)
-            self.add_note_btn.set_visible(False)
-            self._populate_list()
-        elif name == "notes":
-            self.search_entry.set_placeholder_text("Search notes...")
-            self.clear_btn.set_visible(False)
-            self.add_note_btn.set_visible(True)
-            self._populate_notes_list()
-        elif name == "emojis":
-            self.search_entry.set_placeholder_text("Search emojis...")
-            self.clear_btn.set_visible(False)
-            self.add_note_btn.set_visible(False)
-            self._filter_emojis()
+        spec = TAB_SPECS[name]
+        self.search_entry.set_placeholder_text(spec["placeholder"])
+        self.clear_btn.set_visible(spec["show_clear"])
+        self.add_note_btn.set_visible(spec["show_add_note"])
+        self._tab_refresh[name]()
 
     # ===== EMOJI METHODS =====
 
     def _populate_emoji_list(self) -> None:
-        """Populate the emoji list."""
-        for emoji in EMOJI_DATA:
-            btn = Gtk.Button(label=emoji["char"])
-            btn.add_css_class("emoji-button")
-            btn.add_css_class("flat")
-            # Store metadata for filtering
-            btn.emoji_name = emoji["name"].lower()
-            btn.emoji_keywords = [k.lower() for k in emoji["keywords"]]
-            btn.emoji_char = emoji["char"]
-
-            # Use partial to capture the emoji char in lambda/callback
-            btn.connect("clicked", self._on_emoji_clicked, emoji["char"])
-            self.emoji_flowbox.append(btn)
+        """Populate the emoji model."""
+        # The emoji table is only imported once the emoji tab is first shown
+        from .emoji_data import EMOJI_SEARCH_BLOBS
+
+        self._emoji_model.splice(0, 0, [
+            f"{char}\t{search_text}" for char, search_text in EMOJI_SEARCH_BLOBS
+        ])
+
+    def _on_emoji_item_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Create the label reused by a grid cell."""
+        label = Gtk.Label()
+        label.add_css_class("emoji-cell")
+        list_item.set_child(label)
+
+    def _on_emoji_item_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Show the bound emoji on a recycled cell."""
+        list_item.get_child().set_label(_emoji_char(list_item.get_item().get_string()))
 
     def _filter_emojis(self) -> None:
         """Filter emojis based on search query."""
-        query = self._current_filter.lower()
-        child = self.emoji_flowbox.get_first_child()
-        while child:
-            # child is a Gtk.FlowBoxChild, child.get_child() is our Button
-            btn = child.get_child()
-            if isinstance(btn, Gtk.Button):
-                visible = not query or (
-                    query in btn.emoji_name or
-                    query in btn.emoji_char or
-                    any(query in k for k in btn.emoji_keywords)
-                )
-                child.set_visible(visible)
-            child = child.get_next_sibling()
-
-    def _on_emoji_clicked(self, button: Gtk.Button, emoji_char: str) -> None:
-        """Handle emoji click."""
-        content = Gdk.ContentProvider.new_for_value(emoji_char)
-        self.clipboard.set_content(content)
+        if not self._emoji_loaded:
+            self._populate_emoji_list()
+            self._emoji_loaded = True
+
+        # The filter works out itself whether the change is stricter or looser
+        self._emoji_filter.set_search(self._current_filter)
+
+    def _on_emoji_activated(self, grid: Gtk.GridView, position: int) -> None:
+        """Copy the activated emoji to the clipboard."""
+        entry = grid.get_model().get_item(position)
+        if entry is not None and not self._is_repeat_copy(f"emoji:{entry.get_string()}"):
+            content = Gdk.ContentProvider.new_for_value(_emoji_char(entry.get_string()))
+            self.clipboard.set_content(content)
         self.close()
 
     # ===== NOTES METHODS =====
 
     def _populate_notes_list(self) -> None:
-        """Populate the notes list."""
-        while True:
-            row = self.notes_listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self.notes_listbox.remove(row)
-
-        notes = self.db.get_all_notes()
-
-        if self._current_filter:
-            query = self._current_filter.lower()
-            notes = [n for n in notes if query in n.get("title", "").lower() or query in n.get("body", "").lower()]
-
-        for note in notes:
-            row = NoteRow(
-                note,
-                on_delete=self._delete_note,
-                on_edit=self._edit_note,
-                on_pin=self._pin_note
+        """Populate the notes list.
+
+        Notes are read from the database on a worker thread, once and then
+        again only when its notes version moved past the model's; searches
+        just refilter the model. Searches while a load is running don't
+        start another one: the load filters with the query current when
+        it lands.
+        """
+        version = self.db.notes_version
+        if version == self._notes_version:
+            self._filter_notes()
+            return
+        if version == self._notes_loading_version:
+            return
+
+        self._notes_loading_version = version
+        self._notes_query_gen += 1
+        generation = self._notes_query_gen
+
+        def on_loaded(notes: List[dict]) -> None:
+            if generation != self._notes_query_gen:
+                return
+            self._notes_loading_version = -1
+            self._show_notes(notes)
+            self._notes_version = version
+            self._filter_notes()
+            # A pin, delete or save during the load isn't in these rows
+            if self.db.notes_version != version:
+                self._schedule_notes_refresh()
+
+        def on_error(error: Exception) -> None:
+            print(f"Error loading notes: {error}")
+            if generation != self._notes_query_gen:
+                return
+            # So the next populate tries again instead of waiting on this load
+            self._notes_loading_version = -1
+            # Leave the loading page for whatever notes the model already has
+            self._on_notes_items_changed(self._notes_filtered, 0, 0, 0)
+
+        self._run_in_background(self._load_notes, on_loaded, on_error)
+
+    def _schedule_notes_refresh(self) -> None:
+        """Refresh the notes list at idle, once for any number of writes.
+
+        Skipped unless the notes tab is showing; the notes version makes
+        the next populate (on present or tab switch) reload instead.
+        """
+        if not self.get_visible() or self._current_tab != "notes":
+            return
+        if not self._notes_refresh_id:
+            self._notes_refresh_id = GLib.idle_add(
+                self._flush_notes_refresh,
+                priority=GLib.PRIORITY_DEFAULT_IDLE
             )
-            self.notes_listbox.append(row)
 
-        if len(notes) == 0:
-            self.notes_stack.set_visible_child_name("empty")
-        else:
-            self.notes_stack.set_visible_child_name("list")
-            first_row = self.notes_listbox.get_row_at_index(0)
-            if first_row:
-                self.notes_listbox.select_row(first_row)
+    def _flush_notes_refresh(self) -> bool:
+        """Idle callback refreshing the notes list after writes."""
+        self._notes_refresh_id = 0
+        self._populate_notes_list()
+        return GLib.SOURCE_REMOVE
 
-    def _edit_note(self, note: dict) -> None:
-        """Open dialog to edit note."""
-        self._show_new_note_dialog(note)
+    def _load_notes(self) -> List[dict]:
+        """Read all notes, lowercasing their searchable text once."""
+        notes = self.db.get_all_notes()
+        for note in notes:
+            # NUL can't be typed into the search entry, so no match spans both fields
+            note["search_text"] = f"{note.get('title') or ''}\0{note.get('body') or ''}".lower()
+        return notes
+
+    def _note_match(self, obj: NoteObject) -> bool:
+        """Filter function for the notes model."""
+        return self._notes_query in obj.note["search_text"]
+
+    def _filter_notes(self) -> None:
+        """Apply the search query to the notes model."""
+        previous, self._notes_query = self._notes_query, self._current_filter.lower()
+        if self._refilter(self._notes_filter, self._note_match, previous, self._notes_query):
+            self._notes_selection.set_selected(0)
+
+    def _notes_written(self, in_sync: bool) -> None:
+        """Keep the model current after a write it applied itself.
+
+        in_sync is whether the model matched the database before the write.
+        """
+        if in_sync:
+            self._notes_version = self.db.notes_version
+
+    def _show_notes(self, notes: List[dict]) -> None:
+        """Update the notes model to notes.
+
+        Like the clipboard model, unchanged notes keep their objects and
+        rows; only changed runs are spliced, or one span while the list
+        isn't mapped.
+        """
+        model = self._notes_model
+        _splice_changes(
+            model,
+            [_note_key(model.get_item(i).note) for i in range(model.get_n_items())],
+            notes,
+            [_note_key(note) for note in notes],
+            NoteObject,
+            batch=not self.notes_list.get_mapped()
+        )
+        self._note_objects = {
+            obj.note["id"]: obj for obj in (model.get_item(i) for i in range(model.get_n_items()))
+        }
+        self._notes_selection.set_selected(0)
+        # items-changed isn't emitted when both old and new lists are empty
+        self._on_notes_items_changed(self._notes_filtered, 0, 0, 0)
+
+    def _on_notes_items_changed(self, model: Gio.ListModel, position: int, removed: int, added: int) -> None:
+        """Show the empty state whenever no note passes the filter."""
+        self._show_list_or_empty(self.notes_stack, "notes", model.get_n_items() > 0)
+
+    def _on_note_item_setup(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Create the row widget reused by a list item."""
+        list_item.set_child(NoteRow())
+
+    def _on_note_item_bind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Show the bound note on a recycled row."""
+        list_item.get_child().set_note(list_item.get_item().note)
+
+    def _on_note_item_unbind(self, factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem) -> None:
+        """Release the note of a row that scrolled out of view."""
+        list_item.get_child().clear()
+
+    def _edit_note(self, note_id: str) -> None:
+        """Open dialog to edit the note with note_id, if it is listed."""
+        obj = self._note_objects.get(note_id)
+        if obj is not None:
+            self._show_new_note_dialog(obj.note)
 
     def _save_note(self, note_id: str, title: str, body: str) -> None:
         """Save a note (from inline editing)."""
@@ -629,18 +1164,43 @@ class PopupWindow(Adw.ApplicationWindow):
 
     def _change_note_color(self, note_id: str, color: str) -> None:
         """Change a note's color."""
+        in_sync = self._notes_version == self.db.notes_version
         self.db.update_note_color(note_id, color)
+        obj = self._note_objects.get(note_id)
+        if obj is not None:
+            obj.note["color"] = color
+            found, position = self._notes_model.find(obj)
+            if found:
+                self._notes_model.splice(position, 1, [self._renew_note_object(obj)])
+        self._notes_written(in_sync)
 
     def _on_add_note_clicked(self, button: Gtk.Button) -> None:
         self._show_new_note_dialog()
 
     def _show_new_note_dialog(self, existing_note: Optional[dict] = None) -> None:
-        """Show a dialog to create or edit a note."""
+        """Show the dialog to create a note, or to edit existing_note."""
+        self._ensure_note_dialog()
         is_edit = existing_note is not None
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading="Edit Note" if is_edit else "New Note",
-        )
+        self._dialog_note = existing_note
+        self._note_dialog.set_heading("Edit Note" if is_edit else "New Note")
+        self._note_title_entry.set_text(existing_note.get("title", "") if is_edit else "")
+
+        buffer = self._note_body_text.get_buffer()
+        buffer.set_text(existing_note.get("body", "") if is_edit else "")
+        # Lets saving tell whether the body was edited without reading it back
+        buffer.set_modified(False)
+
+        color = existing_note.get("color") if is_edit else None
+        self._dialog_initial_color = color if color in self._note_color_buttons else "blue"
+        self._note_color_buttons[self._dialog_initial_color].set_active(True)
+        self._note_dialog.present()
+
+    def _ensure_note_dialog(self) -> None:
+        """Build the note dialog on first use; it is hidden and reused after."""
+        if self._note_dialog is not None:
+            return
+
+        dialog = Adw.MessageDialog(transient_for=self, hide_on_close=True)
 
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
         content_box.set_margin_top(8)
@@ -656,12 +1216,10 @@ class PopupWindow(Adw.ApplicationWindow):
         title_label.add_css_class("dim-label")
         title_box.append(title_label)
 
-        title_entry = Gtk.Entry()
-        title_entry.set_placeholder_text("Enter title...")
-        title_entry.add_css_class("note-title-entry")
-        if is_edit:
-            title_entry.set_text(existing_note.get("title", ""))
-        title_box.append(title_entry)
+        self._note_title_entry = Gtk.Entry()
+        self._note_title_entry.set_placeholder_text("Enter title...")
+        self._note_title_entry.add_css_class("note-title-entry")
+        title_box.append(self._note_title_entry)
         content_box.append(title_box)
 
         # Body text view
@@ -675,53 +1233,33 @@ class PopupWindow(Adw.ApplicationWindow):
         body_scrolled = Gtk.ScrolledWindow()
         body_scrolled.set_min_content_height(180)
         body_scrolled.set_min_content_width(350)
-        body_text = Gtk.TextView()
-        body_text.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
-        body_text.set_top_margin(12)
-        body_text.set_bottom_margin(12)
-        body_text.set_left_margin(12)
-        body_text.set_right_margin(12)
-        body_text.add_css_class("note-body-view")
-        if is_edit:
-            body_text.get_buffer().set_text(existing_note.get("body", ""))
-        body_scrolled.set_child(body_text)
+        self._note_body_text = Gtk.TextView()
+        self._note_body_text.set_wrap_mode(Gtk.WrapMode.WORD_CHAR)
+        self._note_body_text.add_css_class("note-body-view")
+        body_scrolled.set_child(self._note_body_text)
         body_frame.set_child(body_scrolled)
         body_box.append(body_frame)
         content_box.append(body_box)
 
-        # Color picker for new notes
+        # Color picker; grouped toggle buttons, so one is active at a time
         color_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         color_box.set_margin_top(8)
         color_label = Gtk.Label(label="Color:")
         color_label.add_css_class("dim-label")
         color_box.append(color_label)
 
-        initial_color = existing_note.get("color", "blue") if is_edit else "blue"
-        selected_color = [initial_color]
-
-        for color_name in NOTE_COLORS.keys():
-            btn = Gtk.ToggleButton()
-            btn.set_size_request(24, 24)
-            btn.add_css_class("color-picker-button")
-            btn.add_css_class(f"color-btn-{color_name}")
-            btn.set_tooltip_text(color_name.capitalize())
-            if color_name == initial_color:
-                btn.set_active(True)
-                btn.add_css_class("selected")
-
-            def on_color_toggle(button, color=color_name):
-                if button.get_active():
-                    selected_color[0] = color
-                    # Deselect other buttons
-                    child = color_box.get_first_child()
-                    while child:
-                        if isinstance(child, Gtk.ToggleButton) and child != button:
-                            child.set_active(False)
-                            child.remove_css_class("selected")
-                        child = child.get_next_sibling()
-                    button.add_css_class("selected")
-
-            btn.connect("toggled", on_color_toggle)
+        group: Optional[Gtk.ToggleButton] = None
+        for color_name in _COLOR_NAMES:
+            btn = Gtk.ToggleButton(
+                width_request=24,
+                height_request=24,
+                css_classes=["color-picker-button", _COLOR_BTN_CLASSES[color_name]],
+                tooltip_text=_COLOR_TOOLTIPS[color_name],
+            )
+            btn.set_group(group)
+            group = group or btn
+            btn.connect("toggled", self._on_note_color_toggled, color_name)
+            self._note_color_buttons[color_name] = btn
             color_box.append(btn)
 
         content_box.append(color_box)
@@ -731,47 +1269,134 @@ class PopupWindow(Adw.ApplicationWindow):
         dialog.add_response("save", "Save")
         dialog.set_response_appearance("save", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_default_response("save")
+        dialog.connect("response", self._on_note_dialog_response)
+        self._note_dialog = dialog
+
+    def _on_note_color_toggled(self, button: Gtk.ToggleButton, color: str) -> None:
+        """Track the selected note color and mark its button."""
+        if button.get_active():
+            self._dialog_color = color
+            button.add_css_class("selected")
+        else:
+            button.remove_css_class("selected")
+
+    def _on_note_dialog_response(self, dialog: Adw.MessageDialog, response: str) -> None:
+        """Save the new or edited note when the dialog is confirmed."""
+        note, self._dialog_note = self._dialog_note, None
+        buffer = self._note_body_text.get_buffer()
+        if response == "save":
+            self._save_note_from_dialog(note, buffer)
+        # The dialog is kept; don't hold on to the note text until next time
+        buffer.set_text("")
+
+    def _save_note_from_dialog(self, note: Optional[dict], buffer: Gtk.TextBuffer) -> None:
+        """Write the dialog contents as a new note, or as changes to note."""
+        title = self._note_title_entry.get_text().strip() or "Untitled"
+        color = self._dialog_color
+        if note is not None and not buffer.get_modified():
+            if title == note.get("title") and color == self._dialog_initial_color:
+                return
+            # Left out of the update
+            body = None
+        else:
+            body = buffer.props.text
 
-        def on_response(dialog, response):
-            if response == "save":
-                title = title_entry.get_text().strip() or "Untitled"
-                buffer = body_text.get_buffer()
-                start, end = buffer.get_bounds()
-                body = buffer.get_text(start, end, False)
-
-                if is_edit:
-                    self.db.update_note(existing_note["id"], title, body)
-                    self.db.update_note_color(existing_note["id"], selected_color[0])
-                else:
-                    note_id = str(uuid.uuid4())
-                    self.db.add_note(note_id, title, body, time.time(), selected_color[0])
-
-                self._populate_notes_list()
-
-        dialog.connect("response", on_response)
-        dialog.present()
+        if note is not None:
+            note_id = note["id"]
+            self._write_note(lambda: self.db.update_note(note_id, title, body, color))
+        else:
+            note_id = str(uuid.uuid4())
+            timestamp = time.time()
+            self._write_note(lambda: self.db.add_note(note_id, title, body, timestamp, color))
+
+    def _write_note(self, write: Callable[[], Any]) -> None:
+        """Run a note write off the UI thread, refreshing the list once it's done."""
+        future = self._note_write_pool.submit(write)
+        future.add_done_callback(lambda done: GLib.idle_add(self._on_note_written, done))
+
+    def _on_note_written(self, future: Future) -> bool:
+        """Idle callback refreshing the notes list after a background write.
+
+        The write bumped the notes version on the worker thread, possibly
+        while a pin or delete here took the new version as its own, so the
+        model is marked stale and the next populate reloads whatever the
+        version says.
+        """
+        error = future.exception()
+        if error is not None:
+            print(f"Error saving note: {error}")
+        self._notes_version = -1
+        self._schedule_notes_refresh()
+        return GLib.SOURCE_REMOVE
 
     def _delete_note(self, note_id: str) -> None:
+        in_sync = self._notes_version == self.db.notes_version
         self.db.delete_note(note_id)
-        self._populate_notes_list()
 
-    def _pin_note(self, note_id: str) -> None:
-        self.db.toggle_note_pinned(note_id)
-        self._populate_notes_list()
+        obj = self._note_objects.pop(note_id, None)
+        if obj is not None:
+            found, position = self._notes_model.find(obj)
+            if found:
+                self._notes_model.remove(position)
+        self._notes_written(in_sync)
 
-    def _on_note_row_activated(self, listbox: Gtk.ListBox, row) -> None:
-        # Open edit dialog on click
-        if hasattr(row, "note"):
-            self._show_new_note_dialog(row.note)
+    def _pin_note(self, note_id: str) -> None:
+        in_sync = self._notes_version == self.db.notes_version
+        pinned = self.db.toggle_note_pinned(note_id)
+
+        obj = self._note_objects.get(note_id)
+        if obj is None:
+            return
+        found, position = self._notes_model.find(obj)
+        if not found:
+            return
+        # Move just this note to its new place in the pinned/newest order,
+        # or replace it in place if pinning doesn't move it
+        obj.note["pinned"] = int(pinned)
+        new_position = self._note_position(obj.note, skip=position)
+        new_obj = self._renew_note_object(obj)
+        if new_position == position:
+            self._notes_model.splice(position, 1, [new_obj])
+        else:
+            self._notes_model.remove(position)
+            self._notes_model.insert(new_position, new_obj)
+        self._notes_written(in_sync)
+
+    def _renew_note_object(self, obj: NoteObject) -> NoteObject:
+        """Wrap an updated note in a new model object.
+
+        The list keeps a row bound when the same object is removed and
+        added back, so a changed note needs a new object to be rebound.
+        """
+        new_obj = NoteObject(obj.note)
+        self._note_objects[obj.note["id"]] = new_obj
+        return new_obj
+
+    def _note_position(self, note: dict, skip: int = -1) -> int:
+        """Binary search the position of note in the (sorted) notes model.
+
+        The note at position skip, if any, is left out of the search.
+        """
+        key = _note_sort_key(note)
+        low, high = 0, self._notes_model.get_n_items() - (skip >= 0)
+        while low < high:
+            mid = (low + high) // 2
+            index = mid + (0 <= skip <= mid)
+            if _note_sort_key(self._notes_model.get_item(index).note) <= key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
 
-    def _on_notes_list_click(self, gesture: Gtk.GestureClick, n_press: int, x: float, y: float) -> None:
-        # Removed double click logic since single click (activation) now opens edit
-        # Or we can keep double click to copy
-        pass
+    def _on_note_row_activated(self, list_view: Gtk.ListView, position: int) -> None:
+        # Open edit dialog on activation
+        obj = self._notes_selection.get_item(position)
+        if obj is not None:
+            self._show_new_note_dialog(obj.note)
 
     def _copy_note_to_clipboard(self, note: dict) -> None:
         body = note.get("body", "")
-        if body:
+        if body and not self._is_repeat_copy(f"note:{note['id']}"):
             content = Gdk.ContentProvider.new_for_value(body)
             self.clipboard.set_content(content)
         self.close()
@@ -780,14 +1405,18 @@ class PopupWindow(Adw.ApplicationWindow):
 
     def _on_settings_clicked(self, button: Gtk.Button) -> None:
         """Open settings dialog."""
-        from .settings_dialog import SettingsDialog
-        dialog = SettingsDialog(
-            self,
-            self.config_manager,
-            hotkey_backend_name=self.hotkey_backend_name,
-            hotkey_registered=self.hotkey_registered
-        )
-        dialog.present()
+        if self._settings_dialog is None:
+            from .settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(
+                self,
+                self.config_manager,
+                hotkey_backend_name=self.hotkey_backend_name,
+                hotkey_registered=self.hotkey_registered
+            )
+            self._settings_dialog.set_hide_on_close(True)
+        else:
+            self._settings_dialog.sync_from_config()
+        self._settings_dialog.present()
 
     def _on_private_mode_toggled(self, button: Gtk.ToggleButton) -> None:
         """Toggle private mode."""
@@ -795,6 +1424,11 @@ class PopupWindow(Adw.ApplicationWindow):
 
     def _on_config_changed(self, config) -> None:
         """Handle config changes."""
+        # Most changes (e.g. dragging a settings spin row) leave private mode alone
+        if config.private_mode == self._private_mode_shown:
+            return
+        self._private_mode_shown = config.private_mode
+
         # Update private mode button state
         self.private_mode_btn.set_active(config.private_mode)
 
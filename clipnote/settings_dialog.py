@@ -5,13 +5,32 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from typing import Callable, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
 from .config import Config, ConfigManager
 from .hotkey_manager import format_keybinding, parse_keybinding, validate_keybinding
 
+# Quiet time after the last spin row change before the config is saved
+CONFIG_SAVE_DELAY_MS = 500
+
+# Modifier masks with their display names and GTK binding prefixes, in
+# the order shortcuts are written
+_MODIFIER_NAMES = (
+    (Gdk.ModifierType.SUPER_MASK, "Super", "<Super>"),
+    (Gdk.ModifierType.CONTROL_MASK, "Ctrl", "<Control>"),
+    (Gdk.ModifierType.ALT_MASK, "Alt", "<Alt>"),
+    (Gdk.ModifierType.SHIFT_MASK, "Shift", "<Shift>"),
+)
+
+# Keys that only add a modifier, so don't complete a shortcut
+_MODIFIER_KEYS = frozenset({
+    "Super_L", "Super_R", "Control_L", "Control_R",
+    "Alt_L", "Alt_R", "Shift_L", "Shift_R",
+    "Meta_L", "Meta_R", "ISO_Level3_Shift",
+})
+
 
 class SettingsDialog(Adw.PreferencesWindow):
     """Settings/Preferences dialog for ClipNote."""
@@ -25,10 +44,32 @@ class SettingsDialog(Adw.PreferencesWindow):
     ):
         super().__init__()
         self.config_manager = config_manager
-        self.config = config_manager.config
         self.hotkey_backend_name = hotkey_backend_name or "Not Available"
         self.hotkey_registered = hotkey_registered
 
+        # Spin row values not saved yet; holding a spin button would
+        # otherwise write the config file for every step
+        self._pending_update: Dict[str, Any] = {}
+        self._save_timeout_id = 0
+        self.connect("close-request", self._on_close_request)
+
+        # Excluded app rows by app id; their remove buttons activate
+        # settings.remove-excluded-app with the app id as target
+        self._excluded_rows: Dict[str, Adw.ActionRow] = {}
+        actions = Gio.SimpleActionGroup()
+        remove_action = Gio.SimpleAction.new("remove-excluded-app", GLib.VariantType.new("s"))
+        remove_action.connect("activate", self._on_remove_excluded_app)
+        actions.add_action(remove_action)
+        self.insert_action_group("settings", actions)
+
+        # Confirmation dialogs, built on first open, then hidden and reused
+        self._add_app_dialog: Optional[Adw.MessageDialog] = None
+        self._clear_data_dialog: Optional[Adw.MessageDialog] = None
+        self._hotkey_dialog: Optional[Adw.MessageDialog] = None
+
+        # Last shortcut captured from key presses, as (display text, GTK binding)
+        self._captured_hotkey: Optional[Tuple[str, str]] = None
+
         self.set_transient_for(parent)
         self.set_modal(True)
         self.set_title("Settings")
@@ -36,9 +77,37 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         self._build_ui()
 
+    @property
+    def config(self) -> Config:
+        """The current configuration, always read through the manager."""
+        return self.config_manager.config
+
     def _build_ui(self) -> None:
-        """Build the settings UI."""
-        # ===== GENERAL PAGE =====
+        """Build the settings UI.
+
+        Only the first page is needed to show the dialog; the others are
+        added in order from a low priority idle callback, after the first
+        frame is drawn.
+        """
+        self._build_general_page()
+        self._pending_pages = iter((
+            self._build_privacy_page,
+            self._build_appearance_page,
+            self._build_shortcuts_page,
+            self._build_about_page,
+        ))
+        GLib.idle_add(self._build_next_page, priority=GLib.PRIORITY_LOW)
+
+    def _build_next_page(self) -> bool:
+        """Idle callback adding the next page that isn't built yet."""
+        build_page = next(self._pending_pages, None)
+        if build_page is None:
+            return GLib.SOURCE_REMOVE
+        build_page()
+        return GLib.SOURCE_CONTINUE
+
+    def _build_general_page(self) -> None:
+        """Build the General page."""
         general_page = Adw.PreferencesPage()
         general_page.set_title("General")
         general_page.set_icon_name("preferences-system-symbolic")
@@ -48,21 +117,14 @@ class SettingsDialog(Adw.PreferencesWindow):
         history_group.set_title("Clipboard History")
         history_group.set_description("Configure how clipboard history is stored")
 
-        # Max history items
-        self.history_size_row = Adw.SpinRow.new_with_range(10, 500, 10)
-        self.history_size_row.set_title("Maximum Items")
-        self.history_size_row.set_subtitle("Number of clipboard items to keep")
-        self.history_size_row.set_value(self.config.max_history_items)
-        self.history_size_row.connect("notify::value", self._on_history_size_changed)
-        history_group.add(self.history_size_row)
-
-        # Auto-expire days
-        self.auto_expire_row = Adw.SpinRow.new_with_range(0, 365, 1)
-        self.auto_expire_row.set_title("Auto-Expire (Days)")
-        self.auto_expire_row.set_subtitle("Delete items older than this (0 = never)")
-        self.auto_expire_row.set_value(self.config.auto_expire_days)
-        self.auto_expire_row.connect("notify::value", self._on_auto_expire_changed)
-        history_group.add(self.auto_expire_row)
+        self._add_spin_row(
+            history_group, "max_history_items", (10, 500, 10),
+            "Maximum Items", "Number of clipboard items to keep"
+        )
+        self._add_spin_row(
+            history_group, "auto_expire_days", (0, 365, 1),
+            "Auto-Expire (Days)", "Delete items older than this (0 = never)"
+        )
 
         general_page.add(history_group)
 
@@ -71,27 +133,21 @@ class SettingsDialog(Adw.PreferencesWindow):
         behavior_group.set_title("Behavior")
         behavior_group.set_description("Configure app behavior")
 
-        # Close on paste
-        self.close_on_paste_row = Adw.SwitchRow()
-        self.close_on_paste_row.set_title("Close on Paste")
-        self.close_on_paste_row.set_subtitle("Close window after pasting an item")
-        self.close_on_paste_row.set_active(self.config.close_on_paste)
-        self.close_on_paste_row.connect("notify::active", self._on_close_on_paste_changed)
-        behavior_group.add(self.close_on_paste_row)
-
-        # Clear on paste
-        self.clear_on_paste_row = Adw.SwitchRow()
-        self.clear_on_paste_row.set_title("Remove After Paste")
-        self.clear_on_paste_row.set_subtitle("Remove item from history after pasting")
-        self.clear_on_paste_row.set_active(self.config.clear_on_paste)
-        self.clear_on_paste_row.connect("notify::active", self._on_clear_on_paste_changed)
-        behavior_group.add(self.clear_on_paste_row)
+        self._add_switch_row(
+            behavior_group, "close_on_paste",
+            "Close on Paste", "Close window after pasting an item"
+        )
+        self._add_switch_row(
+            behavior_group, "clear_on_paste",
+            "Remove After Paste", "Remove item from history after pasting"
+        )
 
         general_page.add(behavior_group)
 
         self.add(general_page)
 
-        # ===== PRIVACY PAGE =====
+    def _build_privacy_page(self) -> None:
+        """Build the Privacy page."""
         privacy_page = Adw.PreferencesPage()
         privacy_page.set_title("Privacy")
         privacy_page.set_icon_name("security-high-symbolic")
@@ -101,13 +157,11 @@ class SettingsDialog(Adw.PreferencesWindow):
         privacy_group.set_title("Privacy Mode")
         privacy_group.set_description("Control clipboard monitoring")
 
-        # Private mode toggle
-        self.private_mode_row = Adw.SwitchRow()
-        self.private_mode_row.set_title("Private Mode")
-        self.private_mode_row.set_subtitle("Pause clipboard monitoring temporarily")
-        self.private_mode_row.set_active(self.config.private_mode)
-        self.private_mode_row.connect("notify::active", self._on_private_mode_changed)
-        privacy_group.add(self.private_mode_row)
+        # Private mode toggle (also synced from the main window, see sync_from_config)
+        self.private_mode_row = self._add_switch_row(
+            privacy_group, "private_mode",
+            "Private Mode", "Pause clipboard monitoring temporarily"
+        )
 
         privacy_page.add(privacy_group)
 
@@ -138,7 +192,8 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         self.add(privacy_page)
 
-        # ===== APPEARANCE PAGE =====
+    def _build_appearance_page(self) -> None:
+        """Build the Appearance page."""
         appearance_page = Adw.PreferencesPage()
         appearance_page.set_title("Appearance")
         appearance_page.set_icon_name("applications-graphics-symbolic")
@@ -148,27 +203,21 @@ class SettingsDialog(Adw.PreferencesWindow):
         display_group.set_title("Display")
         display_group.set_description("Configure how items are displayed")
 
-        # Show previews
-        self.show_previews_row = Adw.SwitchRow()
-        self.show_previews_row.set_title("Show Previews")
-        self.show_previews_row.set_subtitle("Show image thumbnails in the list")
-        self.show_previews_row.set_active(self.config.show_previews)
-        self.show_previews_row.connect("notify::active", self._on_show_previews_changed)
-        display_group.add(self.show_previews_row)
-
-        # Compact mode
-        self.compact_mode_row = Adw.SwitchRow()
-        self.compact_mode_row.set_title("Compact Mode")
-        self.compact_mode_row.set_subtitle("Use smaller row height for more items")
-        self.compact_mode_row.set_active(self.config.compact_mode)
-        self.compact_mode_row.connect("notify::active", self._on_compact_mode_changed)
-        display_group.add(self.compact_mode_row)
+        self._add_switch_row(
+            display_group, "show_previews",
+            "Show Previews", "Show image thumbnails in the list"
+        )
+        self._add_switch_row(
+            display_group, "compact_mode",
+            "Compact Mode", "Use smaller row height for more items"
+        )
 
         appearance_page.add(display_group)
 
         self.add(appearance_page)
 
-        # ===== SHORTCUTS PAGE =====
+    def _build_shortcuts_page(self) -> None:
+        """Build the Shortcuts page."""
         shortcuts_page = Adw.PreferencesPage()
         shortcuts_page.set_title("Shortcuts")
         shortcuts_page.set_icon_name("preferences-desktop-keyboard-shortcuts-symbolic")
@@ -179,12 +228,11 @@ class SettingsDialog(Adw.PreferencesWindow):
         hotkey_group.set_description("System-wide keyboard shortcut to open ClipNote")
 
         # Enable hotkey toggle
-        self.hotkey_enabled_row = Adw.SwitchRow()
-        self.hotkey_enabled_row.set_title("Enable Global Hotkey")
-        self.hotkey_enabled_row.set_subtitle("Register a system-wide shortcut")
-        self.hotkey_enabled_row.set_active(self.config.global_hotkey_enabled)
-        self.hotkey_enabled_row.connect("notify::active", self._on_hotkey_enabled_changed)
-        hotkey_group.add(self.hotkey_enabled_row)
+        hotkey_enabled_row = self._add_switch_row(
+            hotkey_group, "global_hotkey_enabled",
+            "Enable Global Hotkey", "Register a system-wide shortcut"
+        )
+        hotkey_enabled_row.connect("notify::active", self._on_hotkey_enabled_changed)
 
         # Current hotkey display
         self.hotkey_row = Adw.ActionRow()
@@ -220,7 +268,8 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         self.add(shortcuts_page)
 
-        # ===== ABOUT PAGE =====
+    def _build_about_page(self) -> None:
+        """Build the About page."""
         about_page = Adw.PreferencesPage()
         about_page.set_title("About")
         about_page.set_icon_name("help-about-symbolic")
@@ -261,6 +310,14 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         self.add(about_page)
 
+    def sync_from_config(self) -> None:
+        """Update the rows whose settings can change outside the dialog.
+
+        Used when a hidden dialog is shown again; private mode can also
+        be toggled from the main window.
+        """
+        self.private_mode_row.set_active(self.config.private_mode)
+
     def _populate_excluded_apps(self) -> None:
         """Populate the excluded apps list."""
         for app_id in self.config.excluded_apps:
@@ -275,97 +332,151 @@ class SettingsDialog(Adw.PreferencesWindow):
         remove_btn.set_icon_name("user-trash-symbolic")
         remove_btn.set_valign(Gtk.Align.CENTER)
         remove_btn.add_css_class("flat")
-        remove_btn.connect("clicked", lambda b: self._on_remove_excluded_app(app_id, row))
+        remove_btn.set_action_name("settings.remove-excluded-app")
+        remove_btn.set_action_target_value(GLib.Variant.new_string(app_id))
         row.add_suffix(remove_btn)
 
+        self._excluded_rows[app_id] = row
         self.excluded_apps_group.add(row)
 
-    def _on_history_size_changed(self, row: Adw.SpinRow, param) -> None:
-        """Handle history size change."""
-        value = int(row.get_value())
-        self.config_manager.update(max_history_items=value)
-
-    def _on_auto_expire_changed(self, row: Adw.SpinRow, param) -> None:
-        """Handle auto-expire change."""
-        value = int(row.get_value())
-        self.config_manager.update(auto_expire_days=value)
-
-    def _on_close_on_paste_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle close on paste change."""
-        self.config_manager.update(close_on_paste=row.get_active())
-
-    def _on_clear_on_paste_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle clear on paste change."""
-        self.config_manager.update(clear_on_paste=row.get_active())
-
-    def _on_private_mode_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle private mode change."""
-        self.config_manager.update(private_mode=row.get_active())
-
-    def _on_show_previews_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle show previews change."""
-        self.config_manager.update(show_previews=row.get_active())
-
-    def _on_compact_mode_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle compact mode change."""
-        self.config_manager.update(compact_mode=row.get_active())
+    def _queue_update(self, **kwargs) -> None:
+        """Save config values once CONFIG_SAVE_DELAY_MS pass without changes."""
+        self._pending_update.update(kwargs)
+        if self._save_timeout_id:
+            GLib.source_remove(self._save_timeout_id)
+        self._save_timeout_id = GLib.timeout_add(CONFIG_SAVE_DELAY_MS, self._save_pending_update)
+
+    def _save_pending_update(self) -> bool:
+        """Save the queued config values, if any."""
+        self._save_timeout_id = 0
+        if self._pending_update:
+            pending, self._pending_update = self._pending_update, {}
+            self.config_manager.update(**pending)
+        return GLib.SOURCE_REMOVE
+
+    def _on_close_request(self, window: Gtk.Window) -> bool:
+        """Save queued changes right away when the dialog is closed."""
+        if self._save_timeout_id:
+            GLib.source_remove(self._save_timeout_id)
+            self._save_pending_update()
+        return False
+
+    def _add_switch_row(
+        self,
+        group: Adw.PreferencesGroup,
+        key: str,
+        title: str,
+        subtitle: str
+    ) -> Adw.SwitchRow:
+        """Add a switch row showing and saving the bool config value key."""
+        row = Adw.SwitchRow(title=title, subtitle=subtitle, active=getattr(self.config, key))
+        row.connect("notify::active", self._on_switch_changed, key)
+        group.add(row)
+        return row
+
+    def _add_spin_row(
+        self,
+        group: Adw.PreferencesGroup,
+        key: str,
+        limits: Tuple[int, int, int],
+        title: str,
+        subtitle: str
+    ) -> Adw.SpinRow:
+        """Add a spin row showing and saving the int config value key.
+
+        limits is the (lower, upper, step) of the row.
+        """
+        row = Adw.SpinRow.new_with_range(*limits)
+        row.set_title(title)
+        row.set_subtitle(subtitle)
+        row.set_value(getattr(self.config, key))
+        row.connect("notify::value", self._on_spin_changed, key)
+        group.add(row)
+        return row
+
+    def _on_switch_changed(self, row: Adw.SwitchRow, param, key: str) -> None:
+        """Save a switch row change."""
+        # sync_from_config sets rows to what the config already holds
+        if row.get_active() != getattr(self.config, key):
+            self.config_manager.update(**{key: row.get_active()})
+
+    def _on_spin_changed(self, row: Adw.SpinRow, param, key: str) -> None:
+        """Queue a spin row change to be saved."""
+        self._queue_update(**{key: int(row.get_value())})
 
     def _on_add_excluded_app(self, button: Gtk.Button) -> None:
         """Show dialog to add excluded app."""
+        self._ensure_add_app_dialog()
+        self._add_app_entry.set_text("")
+        self._add_app_dialog.present()
+
+    def _ensure_add_app_dialog(self) -> None:
+        """Build the add excluded app dialog on first use."""
+        if self._add_app_dialog is not None:
+            return
+
         dialog = Adw.MessageDialog(
             transient_for=self,
             heading="Add Excluded Application",
+            hide_on_close=True,
         )
 
-        entry = Gtk.Entry()
-        entry.set_placeholder_text("e.g., org.keepassxc.KeePassXC")
-        entry.set_margin_top(12)
-        entry.set_margin_bottom(12)
-        entry.set_margin_start(12)
-        entry.set_margin_end(12)
+        self._add_app_entry = Gtk.Entry()
+        self._add_app_entry.set_placeholder_text("e.g., org.keepassxc.KeePassXC")
+        self._add_app_entry.add_css_class("dialog-entry")
 
-        dialog.set_extra_child(entry)
+        dialog.set_extra_child(self._add_app_entry)
         dialog.add_response("cancel", "Cancel")
         dialog.add_response("add", "Add")
         dialog.set_response_appearance("add", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_default_response("add")
+        dialog.connect("response", self._on_add_app_response)
+        self._add_app_dialog = dialog
 
-        def on_response(dialog, response):
-            if response == "add":
-                app_id = entry.get_text().strip()
-                if app_id and app_id not in self.config.excluded_apps:
-                    self.config_manager.add_excluded_app(app_id)
-                    self._add_excluded_app_row(app_id)
+    def _on_add_app_response(self, dialog: Adw.MessageDialog, response: str) -> None:
+        """Add the entered app id to the exclusion list."""
+        if response == "add":
+            app_id = self._add_app_entry.get_text().strip()
+            if app_id and self.config_manager.add_excluded_app(app_id):
+                self._add_excluded_app_row(app_id)
 
-        dialog.connect("response", on_response)
-        dialog.present()
-
-    def _on_remove_excluded_app(self, app_id: str, row: Adw.ActionRow) -> None:
+    def _on_remove_excluded_app(self, action: Gio.SimpleAction, target: GLib.Variant) -> None:
         """Remove an app from the exclusion list."""
+        app_id = target.get_string()
         self.config_manager.remove_excluded_app(app_id)
-        self.excluded_apps_group.remove(row)
+        row = self._excluded_rows.pop(app_id, None)
+        if row is not None:
+            self.excluded_apps_group.remove(row)
 
     def _on_clear_all_data(self, button: Gtk.Button) -> None:
         """Show confirmation dialog to clear all data."""
+        self._ensure_clear_data_dialog()
+        self._clear_data_dialog.present()
+
+    def _ensure_clear_data_dialog(self) -> None:
+        """Build the clear all data confirmation dialog on first use."""
+        if self._clear_data_dialog is not None:
+            return
+
         dialog = Adw.MessageDialog(
             transient_for=self,
             heading="Clear All Data?",
             body="This will permanently delete all clipboard history and notes. This action cannot be undone.",
+            hide_on_close=True,
         )
 
         dialog.add_response("cancel", "Cancel")
         dialog.add_response("clear", "Clear All")
         dialog.set_response_appearance("clear", Adw.ResponseAppearance.DESTRUCTIVE)
         dialog.set_default_response("cancel")
+        dialog.connect("response", self._on_clear_data_response)
+        self._clear_data_dialog = dialog
 
-        def on_response(dialog, response):
-            if response == "clear":
-                # Emit signal or callback to clear data
-                print("Clearing all data...")
-                # This will be handled by the parent window
-
-        dialog.connect("response", on_response)
-        dialog.present()
+    def _on_clear_data_response(self, dialog: Adw.MessageDialog, response: str) -> None:
+        """Handle the clear all data confirmation."""
+        if response == "clear":
+            # The application owns the store and database; see ClipNoteApp
+            Gio.Application.get_default().activate_action("clear-all-data", None)
 
     def _update_hotkey_display(self) -> None:
         """Update the hotkey row subtitle with current binding."""
@@ -383,82 +494,86 @@ class SettingsDialog(Adw.PreferencesWindow):
             self.status_row.set_subtitle("Not registered (backend unavailable)")
 
     def _on_hotkey_enabled_changed(self, row: Adw.SwitchRow, param) -> None:
-        """Handle hotkey enabled toggle."""
-        self.config_manager.update(global_hotkey_enabled=row.get_active())
+        """Update the status row after the hotkey toggle was saved."""
         self._update_status_display()
 
     def _on_change_hotkey(self, button: Gtk.Button) -> None:
         """Show dialog to change hotkey."""
+        self._ensure_hotkey_dialog()
+        self._hotkey_entry.set_text(format_keybinding(self.config.global_hotkey))
+        self._captured_hotkey = None
+        self._hotkey_dialog.present()
+
+    def _ensure_hotkey_dialog(self) -> None:
+        """Build the change shortcut dialog on first use."""
+        if self._hotkey_dialog is not None:
+            return
+
         dialog = Adw.MessageDialog(
             transient_for=self,
             heading="Change Shortcut",
             body="Press the new key combination, or type it manually.\nExamples: Super + V, Ctrl + Alt + V",
+            hide_on_close=True,
         )
 
         # Entry for manual input
-        entry = Gtk.Entry()
-        current_display = format_keybinding(self.config.global_hotkey)
-        entry.set_text(current_display)
-        entry.set_margin_top(12)
-        entry.set_margin_bottom(12)
-        entry.set_margin_start(12)
-        entry.set_margin_end(12)
+        self._hotkey_entry = Gtk.Entry()
+        self._hotkey_entry.add_css_class("dialog-entry")
 
         # Key press handler
         key_controller = Gtk.EventControllerKey()
+        key_controller.connect("key-pressed", self._on_hotkey_key_pressed)
+        self._hotkey_entry.add_controller(key_controller)
 
-        def on_key_pressed(controller, keyval, keycode, state):
-            # Build key combination from modifiers
-            parts = []
-            if state & Gdk.ModifierType.SUPER_MASK:
-                parts.append("Super")
-            if state & Gdk.ModifierType.CONTROL_MASK:
-                parts.append("Ctrl")
-            if state & Gdk.ModifierType.ALT_MASK:
-                parts.append("Alt")
-            if state & Gdk.ModifierType.SHIFT_MASK:
-                parts.append("Shift")
-
-            # Get key name
-            key_name = Gdk.keyval_name(keyval)
-            if key_name and key_name not in ("Super_L", "Super_R", "Control_L", "Control_R",
-                                              "Alt_L", "Alt_R", "Shift_L", "Shift_R",
-                                              "Meta_L", "Meta_R", "ISO_Level3_Shift"):
-                if parts:  # Only if there's at least one modifier
-                    parts.append(key_name.upper())
-                    display = " + ".join(parts)
-                    entry.set_text(display)
-                    return True
-
-            return False
-
-        key_controller.connect("key-pressed", on_key_pressed)
-        entry.add_controller(key_controller)
-
-        dialog.set_extra_child(entry)
+        dialog.set_extra_child(self._hotkey_entry)
         dialog.add_response("cancel", "Cancel")
         dialog.add_response("apply", "Apply")
         dialog.set_response_appearance("apply", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_default_response("apply")
+        dialog.connect("response", self._on_hotkey_response)
+        self._hotkey_dialog = dialog
+
+    def _on_hotkey_key_pressed(self, controller, keyval, keycode, state) -> bool:
+        """Capture a shortcut pressed in the hotkey entry."""
+        # Build key combination from modifiers
+        modifiers = [(name, prefix) for mask, name, prefix in _MODIFIER_NAMES if state & mask]
+
+        # Get key name
+        key_name = Gdk.keyval_name(keyval)
+        if key_name and key_name not in _MODIFIER_KEYS:
+            if modifiers:  # Only if there's at least one modifier
+                parts = [name for name, _prefix in modifiers]
+                parts.append(key_name.upper())
+                display = " + ".join(parts)
+                # The GTK binding is known here, so Apply needn't parse it back
+                binding = "".join(prefix for _name, prefix in modifiers) + key_name.lower()
+                self._captured_hotkey = (display, binding)
+                self._hotkey_entry.set_text(display)
+                return True
+
+        return False
+
+    def _on_hotkey_response(self, dialog: Adw.MessageDialog, response: str) -> None:
+        """Apply the shortcut in the hotkey entry."""
+        if response != "apply":
+            return
+
+        display_text = self._hotkey_entry.get_text().strip()
+        if self._captured_hotkey and self._captured_hotkey[0] == display_text:
+            gtk_binding = self._captured_hotkey[1]
+        else:
+            gtk_binding = parse_keybinding(display_text)
 
-        def on_response(dialog, response):
-            if response == "apply":
-                display_text = entry.get_text().strip()
-                gtk_binding = parse_keybinding(display_text)
-
-                if validate_keybinding(gtk_binding):
-                    self.config_manager.update(global_hotkey=gtk_binding)
-                    self._update_hotkey_display()
-                    # Note: actual re-registration happens via config listener in main.py
-                else:
-                    # Show error
-                    error_dialog = Adw.MessageDialog(
-                        transient_for=self,
-                        heading="Invalid Shortcut",
-                        body=f"'{display_text}' is not a valid shortcut.\nUse format: Modifier + Key (e.g., Super + V)",
-                    )
-                    error_dialog.add_response("ok", "OK")
-                    error_dialog.present()
-
-        dialog.connect("response", on_response)
-        dialog.present()
+        if validate_keybinding(gtk_binding):
+            self.config_manager.update(global_hotkey=gtk_binding)
+            self._update_hotkey_display()
+            # Note: actual re-registration happens via config listener in main.py
+        else:
+            # Show error
+            error_dialog = Adw.MessageDialog(
+                transient_for=self,
+                heading="Invalid Shortcut",
+                body=f"'{display_text}' is not a valid shortcut.\nUse format: Modifier + Key (e.g., Super + V)",
+            )
+            error_dialog.add_response("ok", "OK")
+            error_dialog.present()
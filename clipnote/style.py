@@ -0,0 +1,45 @@
+"""Stylesheet loading for ClipNote."""
+
+from pathlib import Path
+from typing import Set
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Gdk", "4.0")
+
+from gi.repository import Gdk, Gtk
+
+CSS_PATH = Path(__file__).parent / "style.css"
+
+# Names of displays that already have the stylesheet installed
+_CSS_INSTALLED: Set[str] = set()
+
+
+def ensure_css(display: Gdk.Display) -> bool:
+    """Parse style.css and attach it to the display, at most once per display.
+
+    Returns:
+        True if the stylesheet is installed on the display
+    """
+    if display is None:
+        return False
+
+    name = display.get_name()
+    if name in _CSS_INSTALLED:
+        return True
+
+    if not CSS_PATH.exists():
+        print(f"ClipNote: CSS file not found at {CSS_PATH}")
+        return False
+
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_path(str(CSS_PATH))
+    Gtk.StyleContext.add_provider_for_display(
+        display,
+        css_provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _CSS_INSTALLED.add(name)
+    print(f"ClipNote: Loaded custom CSS from {CSS_PATH}")
+    return True